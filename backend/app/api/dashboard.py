@@ -1,11 +1,10 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc
+from sqlalchemy import JSON, case, cast, func, desc, literal_column, true
 from datetime import datetime, timedelta
-from collections import Counter
 from typing import List, Optional
 
-from app.models.database import get_db
+from app.models.database import get_db, is_sqlite
 from app.models.models import TrendItem
 from app.schemas.schemas import (
     DashboardSummary,
@@ -15,6 +14,7 @@ from app.schemas.schemas import (
     FabricationStats,
     TrendLeader,
 )
+from app.services.cache_service import CacheService
 
 router = APIRouter(prefix="/api/dashboard", tags=["dashboard"])
 
@@ -32,90 +32,67 @@ async def get_dashboard_summary(
     - days: Number of days to look back for statistics
     - demographic: Filter by demographic (junior_girls, young_women, contemporary, kids)
     """
-    cutoff_date = datetime.utcnow() - timedelta(days=days)
-
-    # Base query for active trends within timeframe
-    base_query = db.query(TrendItem).filter(
-        TrendItem.status == "active",
-        TrendItem.submitted_at >= cutoff_date,
+    # The summary only changes when trends do: every trend writer bumps the
+    # dashboard namespace version (CacheService.TREND_NAMESPACES). The date is
+    # in the key because new_today rolls over at midnight, and the TTL bounds
+    # how far the sliding window can drift while the data stands still.
+    cache_key = CacheService.versioned_key(
+        CacheService.DASHBOARD_NAMESPACE, days, demographic, datetime.utcnow().date()
     )
-    if demographic:
-        base_query = base_query.filter(TrendItem.demographic == demographic)
+    if cache_key:
+        cached = CacheService.get(cache_key)
+        if cached is not None:
+            return Response(content=cached, media_type="application/json")
 
-    trends = base_query.all()
+    cutoff_date = datetime.utcnow() - timedelta(days=days)
 
-    # Calculate total active trends
-    total_query = db.query(TrendItem).filter(TrendItem.status == "active")
+    # Filters for active trends within timeframe; every aggregate below runs in SQL
+    window = [TrendItem.status == "active", TrendItem.submitted_at >= cutoff_date]
     if demographic:
-        total_query = total_query.filter(TrendItem.demographic == demographic)
-    total_active = total_query.count()
+        window.append(TrendItem.demographic == demographic)
 
-    # Calculate new today
+    # Total active trends and new today, counted together in one pass
+    # (a bare COUNT, not Query.count()'s SELECT count(*) FROM (SELECT ...))
     today_cutoff = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-    today_query = db.query(TrendItem).filter(
-        TrendItem.status == "active",
-        TrendItem.submitted_at >= today_cutoff,
-    )
+    active = [TrendItem.status == "active"]
     if demographic:
-        today_query = today_query.filter(TrendItem.demographic == demographic)
-    new_today = today_query.count()
+        active.append(TrendItem.demographic == demographic)
+    total_active, new_today = db.query(
+        func.count(),
+        func.count().filter(TrendItem.submitted_at >= today_cutoff),
+    ).filter(*active).one()
 
     # Top categories by count
-    category_counts = Counter()
-    category_scores = {}
-    for trend in trends:
-        if trend.category:
-            category_counts[trend.category] += 1
-            if trend.category not in category_scores:
-                category_scores[trend.category] = []
-            category_scores[trend.category].append(trend.trend_score)
-
+    category_count = func.count().label("count")
     top_categories = [
-        CategoryStats(
-            name=category,
-            count=count,
-            trend_score=sum(category_scores[category]) / len(category_scores[category]),
+        CategoryStats(name=row.category, count=row.count, trend_score=row.trend_score or 0.0)
+        for row in db.query(
+            TrendItem.category,
+            category_count,
+            func.avg(TrendItem.trend_score).label("trend_score"),
         )
-        for category, count in category_counts.most_common(10)
+        .filter(*window, TrendItem.category.isnot(None))
+        .group_by(TrendItem.category)
+        .order_by(desc(category_count))
+        .limit(10)
     ]
 
-    # Trending colors (most common)
-    color_counts = Counter()
-    for trend in trends:
-        if trend.colors:
-            for color in trend.colors:
-                color_counts[color] += 1
-
+    # Trending colors, style tags and fabrications (most common), counted in SQL
     trending_colors = [
         ColorStats(color=color, count=count)
-        for color, count in color_counts.most_common(10)
+        for color, count in _top_tags(db, TrendItem.colors, window)
     ]
-
-    # Trending style tags (most common)
-    style_counts = Counter()
-    for trend in trends:
-        if trend.style_tags:
-            for style in trend.style_tags:
-                style_counts[style] += 1
-
     trending_styles = [
         StyleStats(style=style, count=count)
-        for style, count in style_counts.most_common(10)
+        for style, count in _top_tags(db, TrendItem.style_tags, window)
     ]
-
-    # Trending fabrications (most common)
-    fab_counts = Counter()
-    for trend in trends:
-        if trend.fabrications:
-            for fab in trend.fabrications:
-                fab_counts[fab] += 1
-
     trending_fabrications = [
         FabricationStats(fabrication=fab, count=count)
-        for fab, count in fab_counts.most_common(10)
+        for fab, count in _top_tags(db, TrendItem.fabrications, window)
     ]
 
-    # Velocity leaders (top 5 by velocity_score)
+    # Velocity leaders (top 5 by velocity_score) — ORDER BY/LIMIT walks the
+    # active velocity index instead of sorting the whole window in Python
     velocity_leaders = [
         TrendLeader(
             id=trend.id,
@@ -124,10 +101,15 @@ async def get_dashboard_summary(
             velocity_score=trend.velocity_score,
             trend_score=trend.trend_score,
         )
-        for trend in sorted(trends, key=lambda t: t.velocity_score, reverse=True)[:5]
+        for trend in db.query(
+            TrendItem.id, TrendItem.url, TrendItem.category, TrendItem.velocity_score, TrendItem.trend_score
+        )
+        .filter(*window)
+        .order_by(desc(TrendItem.velocity_score), desc(TrendItem.id))
+        .limit(5)
     ]
 
-    return DashboardSummary(
+    summary = DashboardSummary(
         top_categories=top_categories,
         trending_colors=trending_colors,
         trending_styles=trending_styles,
@@ -138,3 +120,40 @@ async def get_dashboard_summary(
         demographic_filter=demographic,
         timestamp=datetime.utcnow(),
     )
+    if cache_key:
+        CacheService.set(cache_key, summary.model_dump_json(), CacheService.DASHBOARD_TTL_SECONDS)
+    return summary
+
+
+def _top_tags(db: Session, column, filters: list, limit: int = 10) -> list:
+    """
+    Most frequent values of a JSON string-array column across matching trends.
+
+    The arrays are unnested and counted by the database (json_array_elements_text
+    on Postgres, json_each on SQLite), so only the top ``limit`` (value, count)
+    pairs come back instead of every trend's decoded tag lists.
+    """
+    if is_sqlite:
+        elements = func.json_each(column).table_valued("value")
+        filters = [*filters, func.json_type(column) == "array"]
+    else:
+        # db/schema.sql makes the tag columns JSONB, create_all() makes them
+        # JSON; the json_* functions only take json, so cast either way.
+        # A None list is stored as JSON 'null', which json_array_elements_text
+        # rejects, and a WHERE check doesn't guarantee it runs first, so
+        # non-arrays are swapped for '[]' in the argument itself.
+        column = cast(column, JSON)
+        column = case((func.json_typeof(column) == "array", column), else_=literal_column("'[]'::json"))
+        elements = func.json_array_elements_text(column).table_valued("value")
+
+    count = func.count().label("count")
+    return (
+        db.query(elements.c.value, count)
+        .select_from(TrendItem)
+        .join(elements, true())
+        .filter(*filters)
+        .group_by(elements.c.value)
+        .order_by(desc(count), elements.c.value)
+        .limit(limit)
+        .all()
+    )
@@ -37,8 +37,19 @@ def _run_insights_generation():
     try:
         _insights_status["progress"] = "Aggregating trend data by category..."
 
-        # 1. Get all active trends
-        trends = db.query(TrendItem).filter(TrendItem.status == "active").all()
+        # 1. Get all active trends — plain rows of just the columns aggregated
+        # below, so no narratives/URLs are read and no ORM instances are built
+        trends = db.query(
+            TrendItem.id,
+            TrendItem.category,
+            TrendItem.trend_score,
+            TrendItem.colors,
+            TrendItem.patterns,
+            TrendItem.style_tags,
+            TrendItem.fabrications,
+            TrendItem.demographic,
+            TrendItem.price_point,
+        ).filter(TrendItem.status == "active").all()
         if not trends:
             _insights_status["status"] = "failed"
             _insights_status["error"] = "No active trends found"
@@ -73,7 +73,7 @@ async def get_monitoring_target(
     db: Session = Depends(get_db),
 ):
     """Get a specific monitoring target."""
-    target = db.query(MonitoringTarget).filter(MonitoringTarget.id == target_id).first()
+    target = db.get(MonitoringTarget, target_id)
     if not target:
         raise HTTPException(status_code=404, detail="Monitoring target not found")
     return target
@@ -86,7 +86,7 @@ async def update_monitoring_target(
     db: Session = Depends(get_db),
 ):
     """Update a monitoring target."""
-    target = db.query(MonitoringTarget).filter(MonitoringTarget.id == target_id).first()
+    target = db.get(MonitoringTarget, target_id)
     if not target:
         raise HTTPException(status_code=404, detail="Monitoring target not found")
 
@@ -106,7 +106,7 @@ async def delete_monitoring_target(
     db: Session = Depends(get_db),
 ):
     """Delete a monitoring target."""
-    target = db.query(MonitoringTarget).filter(MonitoringTarget.id == target_id).first()
+    target = db.get(MonitoringTarget, target_id)
     if not target:
         raise HTTPException(status_code=404, detail="Monitoring target not found")
 
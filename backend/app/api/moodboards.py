@@ -1,10 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import desc, func
 from typing import List, Optional
 
 from app.models.database import get_db
-from app.models.models import MoodBoard, TrendItem
+from app.models.models import MoodBoard, MoodBoardItem, TrendItem
 from app.schemas.schemas import (
     MoodBoardCreate,
     MoodBoardResponse,
@@ -14,6 +14,40 @@ from app.schemas.schemas import (
 router = APIRouter(prefix="/api/moodboards", tags=["moodboards"])
 
 
+def _check_items_exist(db: Session, item_ids: List[int]):
+    """400 unless every id names a trend item; one COUNT, no rows loaded."""
+    unique_ids = set(item_ids)
+    found = db.query(func.count(TrendItem.id)).filter(TrendItem.id.in_(unique_ids)).scalar()
+    if found != len(unique_ids):
+        raise HTTPException(status_code=400, detail="One or more trend items not found")
+
+
+def _set_board_items(board: MoodBoard, item_ids: List[int]):
+    """Make the board hold exactly these items, in this order."""
+    existing = {entry.trend_item_id: entry for entry in board.entries}
+    entries = []
+    for position, trend_item_id in enumerate(dict.fromkeys(item_ids)):
+        entry = existing.get(trend_item_id) or MoodBoardItem(trend_item_id=trend_item_id)
+        entry.position = position
+        entries.append(entry)
+    board.entries = entries
+    # Membership lives in mood_board_items, so an items-only edit wouldn't
+    # otherwise UPDATE the board row and fire its onupdate
+    board.updated_at = func.now()
+
+
+def _get_board(db: Session, board_id: int, with_trends: bool = False) -> Optional[MoodBoard]:
+    """Load a board with its entries (and optionally their trend items) eagerly."""
+    entries = selectinload(MoodBoard.entries)
+    if with_trends:
+        entries = entries.joinedload(MoodBoardItem.trend_item)
+    return db.get(
+        MoodBoard, board_id,
+        options=[entries],
+        populate_existing=True,  # an instance already in the session still gets the eager load
+    )
+
+
 @router.post("", response_model=MoodBoardResponse)
 async def create_moodboard(
     moodboard: MoodBoardCreate,
@@ -22,22 +56,19 @@ async def create_moodboard(
     """Create a new mood board."""
     # Verify all items exist
     if moodboard.item_ids:
-        items = db.query(TrendItem).filter(TrendItem.id.in_(moodboard.item_ids)).all()
-        if len(items) != len(moodboard.item_ids):
-            raise HTTPException(status_code=400, detail="One or more trend items not found")
+        _check_items_exist(db, moodboard.item_ids)
 
     board = MoodBoard(
         title=moodboard.title,
         description=moodboard.description,
         created_by=moodboard.created_by,
         category=moodboard.category,
-        items=moodboard.item_ids,
     )
+    _set_board_items(board, moodboard.item_ids)
 
     db.add(board)
     db.commit()
-    db.refresh(board)
-    return board
+    return _get_board(db, board.id)
 
 
 @router.get("", response_model=List[MoodBoardResponse])
@@ -57,7 +88,7 @@ async def list_moodboards(
     - limit: Max items to return
     - offset: Pagination offset
     """
-    query = db.query(MoodBoard)
+    query = db.query(MoodBoard).options(selectinload(MoodBoard.entries))
 
     if created_by:
         query = query.filter(MoodBoard.created_by == created_by)
@@ -76,15 +107,11 @@ async def get_moodboard(
     db: Session = Depends(get_db),
 ):
     """Get a specific mood board with its trend items."""
-    board = db.query(MoodBoard).filter(MoodBoard.id == board_id).first()
+    board = _get_board(db, board_id, with_trends=True)
     if not board:
         raise HTTPException(status_code=404, detail="Mood board not found")
 
-    # Fetch related trend items
-    if board.items:
-        trend_items = db.query(TrendItem).filter(TrendItem.id.in_(board.items)).all()
-        board.trend_items = trend_items
-
+    board.trend_items = [entry.trend_item for entry in board.entries]
     return board
 
 
@@ -95,16 +122,15 @@ async def update_moodboard(
     db: Session = Depends(get_db),
 ):
     """Update a mood board."""
-    board = db.query(MoodBoard).filter(MoodBoard.id == board_id).first()
+    board = _get_board(db, board_id)
     if not board:
         raise HTTPException(status_code=404, detail="Mood board not found")
 
     # Verify items exist if provided
     if update.items is not None:
-        items = db.query(TrendItem).filter(TrendItem.id.in_(update.items)).all()
-        if len(items) != len(update.items):
-            raise HTTPException(status_code=400, detail="One or more trend items not found")
-        board.items = update.items
+        if update.items:
+            _check_items_exist(db, update.items)
+        _set_board_items(board, update.items)
 
     if update.title is not None:
         board.title = update.title
@@ -114,8 +140,7 @@ async def update_moodboard(
         board.category = update.category
 
     db.commit()
-    db.refresh(board)
-    return board
+    return _get_board(db, board_id)
 
 
 @router.delete("/{board_id}")
@@ -124,7 +149,7 @@ async def delete_moodboard(
     db: Session = Depends(get_db),
 ):
     """Delete a mood board."""
-    board = db.query(MoodBoard).filter(MoodBoard.id == board_id).first()
+    board = db.get(MoodBoard, board_id)
     if not board:
         raise HTTPException(status_code=404, detail="Mood board not found")
 
@@ -3,7 +3,7 @@
 import logging
 from collections import Counter
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, joinedload, selectinload
 from sqlalchemy import desc, func
 from typing import Optional, List
 
@@ -23,6 +23,15 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/people", tags=["people"])
 
 
+def _get_person_with_platforms(db: Session, person_id: int) -> Optional[Person]:
+    """Load a person for PersonResponse; platforms is lazy="raise" on the model."""
+    return db.get(
+        Person, person_id,
+        options=[selectinload(Person.platforms)],
+        populate_existing=True,  # an instance already in the session still gets the eager load
+    )
+
+
 @router.get("/stats", response_model=PersonStats)
 async def get_people_stats(db: Session = Depends(get_db)):
     """Get aggregate stats about the people database."""
@@ -92,8 +101,7 @@ async def add_person(data: PersonCreate, db: Session = Depends(get_db)):
 
     person.follower_count_total = total_followers
     db.commit()
-    db.refresh(person)
-    return person
+    return _get_person_with_platforms(db, person.id)
 
 
 @router.post("/bulk", response_model=dict)
@@ -204,9 +212,7 @@ async def list_people(
 @router.get("/{person_id}", response_model=PersonResponse)
 async def get_person(person_id: int, db: Session = Depends(get_db)):
     """Get a specific person with their platforms."""
-    person = db.query(Person).options(
-        joinedload(Person.platforms)
-    ).filter(Person.id == person_id).first()
+    person = _get_person_with_platforms(db, person_id)
     if not person:
         raise HTTPException(status_code=404, detail="Person not found")
     return person
@@ -217,7 +223,7 @@ async def update_person(
     person_id: int, update: PersonUpdate, db: Session = Depends(get_db)
 ):
     """Update a person's info."""
-    person = db.query(Person).filter(Person.id == person_id).first()
+    person = db.get(Person, person_id)
     if not person:
         raise HTTPException(status_code=404, detail="Person not found")
 
@@ -225,14 +231,13 @@ async def update_person(
         setattr(person, field, value)
 
     db.commit()
-    db.refresh(person)
-    return person
+    return _get_person_with_platforms(db, person_id)
 
 
 @router.delete("/{person_id}")
 async def delete_person(person_id: int, db: Session = Depends(get_db)):
     """Delete a person and all their platforms/scraped posts."""
-    person = db.query(Person).filter(Person.id == person_id).first()
+    person = db.get(Person, person_id)
     if not person:
         raise HTTPException(status_code=404, detail="Person not found")
     db.delete(person)
@@ -245,7 +250,7 @@ async def add_platform_to_person(
     person_id: int, platform: PersonPlatformCreate, db: Session = Depends(get_db)
 ):
     """Add a platform handle to an existing person."""
-    person = db.query(Person).filter(Person.id == person_id).first()
+    person = db.get(Person, person_id)
     if not person:
         raise HTTPException(status_code=404, detail="Person not found")
 
@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, func
+from sqlalchemy import desc, exists, func
 from datetime import datetime
 from typing import List, Optional
 
@@ -117,7 +117,7 @@ async def respond_to_recommendation(
     db: Session = Depends(get_db),
 ):
     """Accept, reject, or dismiss a recommendation."""
-    rec = db.query(Recommendation).filter(Recommendation.id == recommendation_id).first()
+    rec = db.get(Recommendation, recommendation_id)
     if not rec:
         raise HTTPException(status_code=404, detail="Recommendation not found")
 
@@ -173,8 +173,8 @@ async def submit_trend_feedback(
     db: Session = Depends(get_db),
 ):
     """Submit thumbs up/down feedback on a trend item."""
-    trend = db.query(TrendItem).filter(TrendItem.id == trend_id).first()
-    if not trend:
+    # Existence only — no need to load the trend row
+    if not db.query(exists().where(TrendItem.id == trend_id)).scalar():
         raise HTTPException(status_code=404, detail="Trend not found")
 
     # Upsert feedback
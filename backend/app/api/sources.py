@@ -19,6 +19,7 @@ from app.schemas.schemas import (
     SocialAccount,
 )
 from app.services.ai_service import AIService
+from app.services.cache_service import CacheService
 
 router = APIRouter(prefix="/api/sources", tags=["sources"])
 
@@ -388,8 +389,8 @@ async def analyze_from_source(
     source.trend_count = (source.trend_count or 0) + 1
     source.last_scraped_at = datetime.utcnow()
 
-    db.commit()
-    db.refresh(trend_item)
+    # Flush for the new id; the metrics row commits in the same transaction
+    db.flush()
 
     metrics = TrendMetricsHistory(
         trend_item_id=trend_item.id,
@@ -402,4 +403,5 @@ async def analyze_from_source(
     db.add(metrics)
     db.commit()
 
+    CacheService.invalidate(*CacheService.TREND_NAMESPACES)
     return trend_item
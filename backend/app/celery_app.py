@@ -10,7 +10,7 @@ celery = Celery(
     "trend_intelligence",
     broker=settings.REDIS_URL,
     backend=settings.REDIS_URL,
-    include=["app.tasks.scraping_tasks"],
+    include=["app.tasks.scraping_tasks", "app.tasks.seed_tasks", "app.tasks.analysis_tasks"],
 )
 
 celery.conf.update(
@@ -25,9 +25,26 @@ celery.conf.update(
     task_acks_late=True,
     task_reject_on_worker_lost=True,
     worker_prefetch_multiplier=1,
+    task_track_started=True,    # report STARTED, not just PENDING, for running jobs
     task_soft_time_limit=300,   # 5 min soft limit
     task_time_limit=600,        # 10 min hard limit
 
+    # Redis connections — reuse a bounded pool instead of reconnecting per
+    # publish, and keep idle sockets alive through proxies/load balancers
+    broker_pool_limit=20,
+    redis_max_connections=50,
+    broker_transport_options={
+        "visibility_timeout": 3600,  # longer than the longest task (seed hard limit)
+        "socket_keepalive": True,
+    },
+
+    # Results — scrapes report nothing anyone reads. Tasks that opt back in
+    # with ignore_result=False: seed jobs, for the STARTED/SUCCESS state shown
+    # by /seed/jobs/<id>, and reanalyze_trend, whose outcome
+    # /analyze/jobs/<id> returns
+    task_ignore_result=True,
+    result_expires=3600,
+
     # Beat schedule — automated scraping jobs
     beat_schedule={
         # Nightly full scrape of high-priority people (priority 1-3)
@@ -1,5 +1,6 @@
 from pydantic_settings import BaseSettings
 from pydantic import field_validator
+from functools import cached_property
 from typing import List, Union
 
 
@@ -12,6 +13,13 @@ class Settings(BaseSettings):
 
     # Database - defaults to SQLite for easy local dev
     DATABASE_URL: str = "sqlite:///./trend_dashboard.db"
+    # Postgres pool, per process. The API and the Celery worker each get one,
+    # so size both together against the server's max_connections.
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    # Create tables / run lightweight migrations at API startup. Leave on for
+    # one process and set false on extra replicas so they skip the schema checks.
+    RUN_MIGRATIONS: bool = True
 
     # Redis
     REDIS_URL: str = "redis://localhost:6379"
@@ -27,6 +35,8 @@ class Settings(BaseSettings):
 
     # Feature flags
     USE_MOCK_AI: bool = True
+    # Claude requests in flight at once for batch analysis (stays under rate limits)
+    AI_CONCURRENCY: int = 8
 
     # Scraping
     APIFY_TOKEN: str = ""
@@ -36,9 +46,9 @@ class Settings(BaseSettings):
     AWS_S3_BUCKET: str = "trend-intelligence-assets"
     AWS_REGION: str = "us-east-1"
 
-    @property
+    @cached_property
     def cors_origins_list(self) -> List[str]:
-        """Parse CORS_ORIGINS string into a list."""
+        """Parse CORS_ORIGINS string into a list (once; settings don't change at runtime)."""
         if self.CORS_ORIGINS == "*":
             return ["*"]
         return [origin.strip() for origin in self.CORS_ORIGINS.split(",")]
@@ -0,0 +1,150 @@
+"""
+Curated fashion images for trends without a scraped image.
+
+FASHION_IMAGES groups verified Unsplash photos by garment type and
+CATEGORY_MAP maps a trend's (lower-cased) category onto one of those groups.
+Used by POST /api/trends/backfill-images. The tables are read-only
+(MappingProxyType of tuples) since every request shares them.
+"""
+
+from types import MappingProxyType
+
+_P = "https://images.unsplash.com/photo-"
+_S = "?w=400&h=500&fit=crop"
+
+# Verified Unsplash photo IDs scraped from category-specific search pages
+FASHION_IMAGES = MappingProxyType({
+    "dress": (
+        f"{_P}1752797203245-3b9e233b2ac8{_S}",
+        f"{_P}1753589435506-cfd036fba85e{_S}",
+        f"{_P}1667890786022-98704b9b8fcb{_S}",
+        f"{_P}1663044023283-9ea59358b6c0{_S}",
+        f"{_P}1663044022894-68a5e6bccd64{_S}",
+        f"{_P}1667890786333-ddb32e7e0d6e{_S}",
+        f"{_P}1663044022903-caa195cb5b2e{_S}",
+        f"{_P}1752797161382-3d0a4edc51dc{_S}",
+        f"{_P}1730141100734-90e06e5966dd{_S}",
+        f"{_P}1730140762303-8bc833a0c0bb{_S}",
+    ),
+    "top": (
+        f"{_P}1724490056260-44bf1de2617e{_S}",
+        f"{_P}1651507178496-7a42c1e19442{_S}",
+        f"{_P}1618371360326-3583fcdb0b10{_S}",
+        f"{_P}1760551600855-cbd4fd31d278{_S}",
+        f"{_P}1574847872646-abff244bbd87{_S}",
+        f"{_P}1763935723482-14ac7f49a3ae{_S}",
+        f"{_P}1689700672469-0017bfeec930{_S}",
+        f"{_P}1663044022913-8913ff9ff2bc{_S}",
+        f"{_P}1766465525646-f4b47c41f061{_S}",
+        f"{_P}1673999707565-8bb553c9765b{_S}",
+    ),
+    "pants": (
+        f"{_P}1695231081377-2765f838043d{_S}",
+        f"{_P}1770364018048-45c991a6c4d2{_S}",
+        f"{_P}1770364018544-7ac645977a79{_S}",
+        f"{_P}1758543144593-95061a3f418a{_S}",
+        f"{_P}1762343290221-d2374e1e2e2c{_S}",
+        f"{_P}1770294760762-1cd821ecc567{_S}",
+        f"{_P}1770364020139-8feb0e4d41cf{_S}",
+        f"{_P}1765828594000-1605dd96033e{_S}",
+        f"{_P}1759851235367-2eb2282414fa{_S}",
+        f"{_P}1762327162259-60c4e56b8523{_S}",
+    ),
+    "skirt": (
+        f"{_P}1608033247410-817c68700611{_S}",
+        f"{_P}1582142306909-195724d33ffc{_S}",
+        f"{_P}1570700006701-4bdeaf669738{_S}",
+        f"{_P}1741943716275-2eaf11f4e918{_S}",
+        f"{_P}1739945533087-1f80850e7d86{_S}",
+        f"{_P}1739945472394-3284ac02996b{_S}",
+        f"{_P}1555180739-0cb3b1d85138{_S}",
+        f"{_P}1633452696817-bae37e248741{_S}",
+        f"{_P}1691315926449-53b463adc4ac{_S}",
+        f"{_P}1544596758-7339ae9a0432{_S}",
+    ),
+    "leggings": (
+        f"{_P}1603920346280-75b4832fb6a7{_S}",
+        f"{_P}1597299001669-6454fec8ac25{_S}",
+        f"{_P}1762331652034-2db35c56350e{_S}",
+        f"{_P}1762331648554-94fdae0956da{_S}",
+        f"{_P}1763771522867-c26bf75f12bc{_S}",
+        f"{_P}1762331654306-49a7e79763c5{_S}",
+        f"{_P}1762331660576-cbf66a7db84d{_S}",
+        f"{_P}1762337380547-efe2df510d98{_S}",
+        f"{_P}1611078844630-85c0a9a34623{_S}",
+        f"{_P}1762337383598-96edda3d55f7{_S}",
+    ),
+    "outerwear": (
+        f"{_P}1706765779494-2705542ebe74{_S}",
+        f"{_P}1608113562252-b320e7628e17{_S}",
+        f"{_P}1548624313-0396c75e4b1a{_S}",
+        f"{_P}1614079290101-0c2181ac8ea3{_S}",
+        f"{_P}1614031679232-0dae776a72ee{_S}",
+        f"{_P}1711527088900-f7ebabda4e3f{_S}",
+        f"{_P}1611025504703-8c143abe6996{_S}",
+        f"{_P}1552327359-d86398116072{_S}",
+        f"{_P}1677123718817-5a203404d638{_S}",
+        f"{_P}1668934804959-2cc138045bfb{_S}",
+    ),
+    "footwear": (
+        f"{_P}1760302318631-a8d342cd4951{_S}",
+        f"{_P}1695459468644-717c8ae17eed{_S}",
+        f"{_P}1768225286074-9039931bb9d3{_S}",
+        f"{_P}1618153478389-b2ed8de18ed3{_S}",
+        f"{_P}1636705941762-ae56d531a7d7{_S}",
+        f"{_P}1597081206405-5a13f38c5f71{_S}",
+        f"{_P}1759542890353-35f5568c1c90{_S}",
+        f"{_P}1650320079970-b4ee8f0dae33{_S}",
+        f"{_P}1560857792-215f9e3534ed{_S}",
+        f"{_P}1598808696311-66be744a23c4{_S}",
+    ),
+    "general": (
+        f"{_P}1739773375456-79be292cedb1{_S}",
+        f"{_P}1739773375426-880a10bea9a9{_S}",
+        f"{_P}1731577506253-0fd9cd00ab7f{_S}",
+        f"{_P}1735553816867-88cd8496df58{_S}",
+        f"{_P}1735553816725-76d4fa5a374e{_S}",
+        f"{_P}1735553816746-229df9b3bd37{_S}",
+        f"{_P}1735553816769-7d30e5b1a19a{_S}",
+        f"{_P}1735553816645-8441289f6db7{_S}",
+        f"{_P}1735553816887-95a2657d5fd8{_S}",
+        f"{_P}1735553816655-1d4cab9fb64c{_S}",
+    ),
+})
+
+# Map specific product categories to image groups
+CATEGORY_MAP = MappingProxyType({
+    "midi dress": "dress", "mini dress": "dress", "slip dress": "dress",
+    "maxi dress": "dress", "shirt dress": "dress", "wrap dress": "dress",
+    "bodycon dress": "dress", "dress": "dress",
+    "crop top": "top", "tank top": "top", "blouse": "top",
+    "t-shirt": "top", "cami top": "top", "corset top": "top",
+    "hoodie": "top", "sweater": "top", "cardigan": "top", "top": "top",
+    "cargo pants": "pants", "wide leg jeans": "pants",
+    "wide leg pants": "pants", "jeans": "pants", "trousers": "pants",
+    "joggers": "pants", "shorts": "pants", "pants": "pants",
+    "leggings": "leggings",
+    "mini skirt": "skirt", "skirt": "skirt", "midi skirt": "skirt",
+    "pleated skirt": "skirt",
+    "platform sneakers": "footwear", "platform boots": "footwear",
+    "boots": "footwear", "heels": "footwear",
+    "sandals": "footwear", "sneakers": "footwear", "mules": "footwear",
+    "loafers": "footwear", "footwear": "footwear",
+    "oversized blazer": "outerwear", "puffer jacket": "outerwear",
+    "trench coat": "outerwear", "denim jacket": "outerwear",
+    "leather jacket": "outerwear", "coat": "outerwear", "jacket": "outerwear",
+    "blazer": "outerwear",
+    "bag": "general", "sunglasses": "general", "jewelry": "general",
+    "hat": "general", "belt": "general", "scarf": "general",
+    "hair accessories": "general", "accessories": "general",
+    "matching set": "general", "co-ord set": "general", "romper": "dress",
+    "jumpsuit": "dress", "bodysuit": "top",
+})
+
+
+# Category → candidate images, resolved once at import
+IMAGES_BY_CATEGORY = MappingProxyType({
+    cat: FASHION_IMAGES.get(group, FASHION_IMAGES["general"])
+    for cat, group in CATEGORY_MAP.items()
+})
+DEFAULT_IMAGES = FASHION_IMAGES["general"]
@@ -1,10 +1,14 @@
+import mimetypes
 import os
+from functools import lru_cache
 from pathlib import Path
+from stat import S_ISREG
+from typing import Optional
 
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse
 from contextlib import asynccontextmanager
 
 from app.config import settings
@@ -16,8 +20,9 @@ from app.api import trends, moodboards, monitoring, dashboard, sources, recommen
 async def lifespan(app: FastAPI):
     """Lifespan context manager for app startup and shutdown."""
     # Startup
-    create_tables()
-    run_migrations()
+    if settings.RUN_MIGRATIONS:
+        create_tables()
+        run_migrations()
     yield
     # Shutdown
     pass
@@ -29,6 +34,7 @@ app = FastAPI(
     version=settings.APP_VERSION,
     description="Backend API for tracking fashion trends for junior customers",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Add CORS middleware
@@ -72,6 +78,45 @@ if STATIC_DIR.exists():
     if assets_dir.exists():
         app.mount("/assets", StaticFiles(directory=str(assets_dir)), name="static-assets")
 
+    STATIC_ROOT = STATIC_DIR.resolve()
+
+    # Files up to this size are kept in memory; bigger ones stream from disk.
+    # With the cache's maxsize that bounds it at 32 MiB.
+    _STATIC_CACHE_MAX_BYTES = 256 * 1024
+
+    STATIC_ROOT_STR = str(STATIC_ROOT)
+    INDEX_PATH = os.path.join(STATIC_ROOT_STR, "index.html")
+
+    @lru_cache(maxsize=1024)
+    def _static_candidate(full_path: str) -> Optional[str]:
+        """The file a request path would map to inside STATIC_DIR, or None if
+        it escapes it. Pure string work, so repeat paths are a dict lookup."""
+        candidate = os.path.normpath(os.path.join(STATIC_ROOT_STR, full_path))
+        if os.path.commonpath([STATIC_ROOT_STR, candidate]) != STATIC_ROOT_STR:
+            return None
+        return candidate
+
+    def _resolve_static(full_path: str) -> tuple:
+        """Map a request path to (file path, stat) for the file to serve: the
+        static file itself if it exists inside STATIC_DIR, else index.html
+        for client-side routing. Stat'd per request so a rebuilt frontend is
+        picked up without a restart."""
+        candidate = _static_candidate(full_path)
+        if candidate is not None:
+            try:
+                st = os.stat(candidate)
+                if S_ISREG(st.st_mode):
+                    return candidate, st
+            except OSError:
+                pass
+        return INDEX_PATH, os.stat(INDEX_PATH)
+
+    @lru_cache(maxsize=128)
+    def _read_static(path: str, mtime_ns: int, size: int) -> bytes:
+        """Contents of a small built frontend file. mtime and size are part of
+        the cache key, so an edited file is re-read on its next request."""
+        return Path(path).read_bytes()
+
     # Catch-all route: serve index.html for any non-API route (SPA routing)
     @app.get("/{full_path:path}")
     async def serve_spa(request: Request, full_path: str):
@@ -80,13 +125,15 @@ if STATIC_DIR.exists():
         if full_path.startswith("api"):
             return {"detail": "Not Found"}
 
-        # Check if the file exists in static directory
-        file_path = STATIC_DIR / full_path
-        if file_path.exists() and file_path.is_file():
-            return FileResponse(str(file_path))
-
-        # Default: serve index.html for SPA client-side routing
-        return FileResponse(str(STATIC_DIR / "index.html"))
+        path, st = _resolve_static(full_path)
+        etag = f'"{st.st_mtime_ns:x}-{st.st_size:x}"'
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        media_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+        if st.st_size > _STATIC_CACHE_MAX_BYTES:
+            return FileResponse(path, media_type=media_type, headers={"ETag": etag}, stat_result=st)
+        content = _read_static(path, st.st_mtime_ns, st.st_size)
+        return Response(content=content, media_type=media_type, headers={"ETag": etag})
 else:
     # No frontend built — show API info at root
     @app.get("/")
@@ -103,4 +150,4 @@ else:
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop="uvloop", http="httptools")
@@ -2,6 +2,7 @@ from app.models.models import (
     TrendItem,
     TrendMetricsHistory,
     MoodBoard,
+    MoodBoardItem,
     TrendingHashtag,
     MonitoringTarget,
     Recommendation,
@@ -13,6 +14,7 @@ __all__ = [
     "TrendItem",
     "TrendMetricsHistory",
     "MoodBoard",
+    "MoodBoardItem",
     "TrendingHashtag",
     "MonitoringTarget",
     "Recommendation",
@@ -1,13 +1,29 @@
-from sqlalchemy import Column, Integer, String, Text, Float, DateTime, Boolean, ForeignKey, JSON, Numeric, Index, UniqueConstraint
+from sqlalchemy import Column, Computed, Integer, String, Text, Float, DateTime, Boolean, ForeignKey, JSON, Numeric, Index, PrimaryKeyConstraint, UniqueConstraint
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 from app.models.database import Base
 from datetime import datetime
 
 
+# WHERE clause for partial indexes over active trends only
+_ACTIVE_ONLY = {
+    "postgresql_where": text("status = 'active'"),
+    "sqlite_where": text("status = 'active'"),
+}
+
+# ...and over active trends still waiting for an image (backfill-images)
+_MISSING_IMAGE_WHERE = "status = 'active' AND (image_url IS NULL OR image_url = '')"
+_ACTIVE_MISSING_IMAGE = {
+    "postgresql_where": text(_MISSING_IMAGE_WHERE),
+    "sqlite_where": text(_MISSING_IMAGE_WHERE),
+}
+
+
 class TrendItem(Base):
     """Main table for tracking individual trend items."""
     __tablename__ = "trend_items"
+    # Fetch submitted_at/last_updated in the INSERT/UPDATE itself (RETURNING)
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     url = Column(String(2048), unique=True, nullable=False, index=True)
@@ -30,6 +46,7 @@ class TrendItem(Base):
     shares = Column(Integer, default=0)
     views = Column(Integer, default=0)
     engagement_rate = Column(Float, default=0.0)
+    engagement_count = Column(Integer, Computed("likes + comments + shares", persisted=True))
 
     # Scoring
     trend_score = Column(Float, default=0.0, index=True)
@@ -49,15 +66,42 @@ class TrendItem(Base):
     fabrications = Column(JSON, nullable=True)  # ["cotton", "polyester blend", "silk"]
     source_id = Column(Integer, ForeignKey("monitoring_targets.id", ondelete="SET NULL"), nullable=True, index=True)
 
-    # Relationships
-    metrics_history = relationship("TrendMetricsHistory", back_populates="trend_item", cascade="all, delete-orphan")
-    source = relationship("MonitoringTarget", foreign_keys=[source_id])
+    # Relationships — lazy="raise" so an unplanned per-row load fails loudly
+    # instead of quietly turning a list endpoint into N+1 queries.
+    # Load them explicitly with selectinload() where they are needed.
+    metrics_history = relationship(
+        "TrendMetricsHistory",
+        back_populates="trend_item",
+        cascade="all, delete-orphan",
+        passive_deletes=True,  # rows go with the ON DELETE CASCADE FK
+        lazy="raise",
+    )
+    source = relationship("MonitoringTarget", foreign_keys=[source_id], lazy="raise")
 
     __table_args__ = (
         Index("idx_trend_items_score_date", "trend_score", "submitted_at"),
         Index("idx_trend_items_velocity_date", "velocity_score", "submitted_at"),
         Index("idx_trend_items_category_status", "category", "status"),
         Index("idx_trend_items_demographic", "demographic", "status"),
+        # Partial indexes matching /daily: active rows, optional filter column,
+        # then the sort column and id descending (the keyset order), so LIMIT
+        # stops after one range scan. Existing databases get these from
+        # run_migrations().
+        Index("idx_trend_items_active_score", trend_score.desc(), id.desc(), **_ACTIVE_ONLY),
+        Index("idx_trend_items_active_velocity", velocity_score.desc(), id.desc(), **_ACTIVE_ONLY),
+        Index("idx_trend_items_active_submitted", submitted_at.desc(), id.desc(), **_ACTIVE_ONLY),
+        Index("idx_trend_items_active_platform_score", "source_platform", trend_score.desc(), id.desc(), **_ACTIVE_ONLY),
+        Index("idx_trend_items_active_category_score", "category", trend_score.desc(), id.desc(), **_ACTIVE_ONLY),
+        Index("idx_trend_items_active_demographic_score", "demographic", trend_score.desc(), id.desc(), **_ACTIVE_ONLY),
+        Index("idx_trend_items_active_engagement", engagement_count.desc(), id.desc(), **_ACTIVE_ONLY),
+        # Dashboard window aggregates (category counts/avg score since a cutoff)
+        # read just these columns, so Postgres can answer from the index alone
+        Index(
+            "idx_trend_items_active_window", submitted_at,
+            postgresql_include=["category", "trend_score", "demographic"], **_ACTIVE_ONLY,
+        ),
+        # Only rows missing an image, so it stays tiny once backfill has run
+        Index("idx_trend_items_active_missing_image", id, **_ACTIVE_MISSING_IMAGE),
     )
 
 
@@ -77,7 +121,7 @@ class TrendMetricsHistory(Base):
     trend_score = Column(Float, default=0.0)
 
     # Relationships
-    trend_item = relationship("TrendItem", back_populates="metrics_history")
+    trend_item = relationship("TrendItem", back_populates="metrics_history", lazy="raise")
 
     __table_args__ = (
         Index("idx_metrics_history_date", "trend_item_id", "recorded_at"),
@@ -98,13 +142,42 @@ class MoodBoard(Base):
     # Categorization
     category = Column(String(100), nullable=True, index=True)  # e.g., "spring 2024", "festival wear"
 
-    # Items in this mood board (trend_item IDs)
-    items = Column(JSON, nullable=True, default=[])  # [1, 2, 3, ...]
+    # Items in this mood board, in board order. Load explicitly with
+    # selectinload(); deleting the board deletes its entries.
+    entries = relationship(
+        "MoodBoardItem",
+        order_by="MoodBoardItem.position",
+        cascade="all, delete-orphan",
+        lazy="raise",
+    )
 
     __table_args__ = (
         Index("idx_mood_boards_created", "created_by", "created_at"),
     )
 
+    @property
+    def items(self) -> list:
+        """Trend item IDs in board order (the API's ``items`` field)."""
+        return [entry.trend_item_id for entry in self.entries]
+
+
+class MoodBoardItem(Base):
+    """A trend item's place on a mood board (replaces the old JSON id list)."""
+    __tablename__ = "mood_board_items"
+
+    mood_board_id = Column(Integer, ForeignKey("mood_boards.id", ondelete="CASCADE"), nullable=False)
+    # Deleting a trend drops it from every board
+    trend_item_id = Column(Integer, ForeignKey("trend_items.id", ondelete="CASCADE"), nullable=False, index=True)
+    position = Column(Integer, nullable=False)
+    added_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    trend_item = relationship("TrendItem", lazy="raise")
+
+    __table_args__ = (
+        PrimaryKeyConstraint("mood_board_id", "trend_item_id"),
+        Index("idx_mood_board_items_board_position", "mood_board_id", "position"),
+    )
+
 
 class TrendingHashtag(Base):
     """Track trending hashtags across platforms."""
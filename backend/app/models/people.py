@@ -45,9 +45,10 @@ class Person(Base):
     last_scraped_at = Column(DateTime(timezone=True), nullable=True)
     notes = Column(Text, nullable=True)
 
-    # Relationships
-    platforms = relationship("PersonPlatform", back_populates="person", cascade="all, delete-orphan")
-    scraped_posts = relationship("ScrapedPost", back_populates="person", cascade="all, delete-orphan")
+    # Relationships — lazy="raise" like TrendItem's, so serializing a list of
+    # people can't quietly issue a query per row. Eager-load what you read.
+    platforms = relationship("PersonPlatform", back_populates="person", cascade="all, delete-orphan", lazy="raise")
+    scraped_posts = relationship("ScrapedPost", back_populates="person", cascade="all, delete-orphan", lazy="raise")
 
     __table_args__ = (
         Index("idx_people_type_tier", "type", "tier"),
@@ -76,7 +77,7 @@ class PersonPlatform(Base):
     apify_actor_id = Column(String(255), nullable=True)  # Which Apify actor to use
 
     # Relationships
-    person = relationship("Person", back_populates="platforms")
+    person = relationship("Person", back_populates="platforms", lazy="raise")
 
     __table_args__ = (
         UniqueConstraint("person_id", "platform", name="uq_person_platform"),
@@ -123,7 +124,7 @@ class ScrapedPost(Base):
     scraped_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
-    person = relationship("Person", back_populates="scraped_posts")
+    person = relationship("Person", back_populates="scraped_posts", lazy="raise")
 
     __table_args__ = (
         UniqueConstraint("platform", "platform_post_id", name="uq_platform_post"),
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, HttpUrl
+from pydantic import BaseModel, Field, HttpUrl
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 
@@ -20,8 +20,8 @@ class TrendItemCreate(BaseModel):
         return self.source_platform or self.platform or "Other"
 
 
-class TrendItemResponse(BaseModel):
-    """Schema for trend item response with all fields."""
+class TrendItemSummary(BaseModel):
+    """Schema for trend items in list views (omits the long AI narrative)."""
     id: int
     url: str
     source_platform: str
@@ -41,6 +41,7 @@ class TrendItemResponse(BaseModel):
     shares: int
     views: int
     engagement_rate: float
+    engagement_count: int = 0  # likes + comments + shares, a generated column
 
     trend_score: float
     velocity_score: float
@@ -49,54 +50,38 @@ class TrendItemResponse(BaseModel):
     scraped_at: Optional[datetime]
     last_updated: datetime
     status: str
-    ai_analysis_text: Optional[str]
 
     # Demographics & Fabrication
     demographic: Optional[str] = None
     fabrications: Optional[List[str]] = None
     source_id: Optional[int] = None
 
-    # Frontend-compatible aliases
-    @property
-    def platform(self) -> str:
-        return self.source_platform
-
-    @property
-    def engagement_count(self) -> int:
-        return self.likes + self.comments + self.shares
+    class Config:
+        from_attributes = True
 
-    @property
-    def ai_analysis(self) -> Optional[str]:
-        return self.ai_analysis_text
 
-    @property
-    def created_at(self) -> datetime:
-        return self.submitted_at
+class TrendItemResponse(TrendItemSummary):
+    """Schema for trend item response with all fields."""
+    ai_analysis_text: Optional[str]
 
-    @property
-    def updated_at(self) -> datetime:
-        return self.last_updated
+    # Frontend-compatible aliases. validation_alias reads them from the ORM
+    # attribute, so pydantic-core fills and dumps them with no per-row Python.
+    platform: str = Field(validation_alias="source_platform")
+    ai_analysis: Optional[str] = Field(None, validation_alias="ai_analysis_text")
+    created_at: datetime = Field(validation_alias="submitted_at")
+    updated_at: datetime = Field(validation_alias="last_updated")
 
     class Config:
         from_attributes = True
 
-    def model_dump(self, **kwargs):
-        d = super().model_dump(**kwargs)
-        d['platform'] = self.source_platform
-        d['engagement_count'] = (d.get('likes', 0) or 0) + (d.get('comments', 0) or 0) + (d.get('shares', 0) or 0)
-        d['ai_analysis'] = d.get('ai_analysis_text')
-        d['created_at'] = d.get('submitted_at')
-        d['updated_at'] = d.get('last_updated')
-        d['demographic'] = d.get('demographic')
-        d['fabrications'] = d.get('fabrications')
-        d['source_id'] = d.get('source_id')
-        return d
-
 
 class TrendItemList(BaseModel):
     """Schema for listing trend items."""
-    items: List[TrendItemResponse]
-    total: int
+    items: List[TrendItemSummary]
+    has_more: bool = False
+    next_cursor: Optional[str] = None  # Pass back as ?cursor= for the next page
+    total: Optional[int] = None  # Only filled in when requested with ?with_total=true
+    estimated_total: Optional[int] = None  # Unfiltered lists only: planner row estimate, no COUNT
     limit: int
     offset: int
 
@@ -1,20 +1,27 @@
 import random
 import asyncio
+import json
 import re
+
+import orjson
+from functools import lru_cache
 from typing import Dict, List, Optional
+from anthropic import Anthropic
 from app.config import settings
 
 
+# Leading ```json / ``` and trailing ``` fence, in one pass
+_FENCE_RE = re.compile(r'\A```(?:json)?\s*|\s*```\s*\Z')
+# Trailing comma before } or ] (common LLM JSON error)
+_TRAILING_COMMA_RE = re.compile(r',\s*([}\]])')
+
+
 def _clean_json_response(text: str) -> str:
     """Strip markdown code fences, fix common JSON issues from Claude responses."""
-    text = text.strip()
     # Remove ```json ... ``` or ``` ... ``` wrappers
-    text = re.sub(r'^```(?:json)?\s*\n?', '', text)
-    text = re.sub(r'\n?```\s*$', '', text)
-    text = text.strip()
-    # Fix trailing commas before } or ] (common LLM JSON error)
-    text = re.sub(r',\s*}', '}', text)
-    text = re.sub(r',\s*]', ']', text)
+    text = _FENCE_RE.sub('', text.strip()).strip()
+    # Fix trailing commas before } or ]
+    text = _TRAILING_COMMA_RE.sub(r'\1', text)
     # Fix single quotes used instead of double quotes (less common but possible)
     # Only do this if json.loads would fail — we'll try strict first
     return text
@@ -144,6 +151,70 @@ MOCK_FABRICATIONS = [
 ]
 
 
+# Static instructions for discover_social_accounts. At roughly 550 tokens it
+# sits well under the 1024-token minimum for prompt caching, so it goes out as
+# a plain system prompt; each brand batch only adds its short brand list.
+_SOCIAL_DISCOVERY_SYSTEM_PROMPT = """You are helping a women's fast fashion apparel company (Mark Edwards Apparel) build a social media intelligence database. Their primary market is junior girls (15-25) and young women (25-35).
+
+For each ecommerce fashion brand the user lists, provide their social media accounts and related influencer accounts.
+
+For EACH brand, provide:
+1. Their official TikTok account (handle and URL) — use real, known handles
+2. Their official Instagram account (handle and URL) — use real, known handles
+3. 1-2 related influencer/creator accounts on TikTok or Instagram who frequently feature that brand (hauls, try-ons, styling videos)
+4. 2-3 relevant hashtags used for that brand on social media
+
+IMPORTANT RULES:
+- Use REAL social media handles that actually exist. If you're not sure about a handle, use the most common/likely format.
+- For official accounts, the handle is usually the brand name (e.g., @zara, @shein, @prettylittlething)
+- For influencers, suggest real popular fashion creators who are known to feature these brands
+- Focus on accounts popular with junior girls (15-25) — Gen Z fashion content
+- Include estimated follower counts where known
+
+Return ONLY valid JSON as an array of objects with this structure:
+[
+  {
+    "brand": "Brand Name",
+    "accounts": [
+      {
+        "platform": "tiktok" or "instagram",
+        "handle": "@handle",
+        "url": "https://www.tiktok.com/@handle" or "https://www.instagram.com/handle/",
+        "name": "Display Name",
+        "type": "official",
+        "description": "Brief description",
+        "estimated_followers": "1M+" or "500K" etc
+      }
+    ],
+    "related_influencers": [
+      {
+        "platform": "tiktok" or "instagram",
+        "handle": "@handle",
+        "url": "full URL",
+        "name": "Creator Name",
+        "description": "Why they're relevant to this brand",
+        "estimated_followers": "200K" etc
+      }
+    ],
+    "hashtags": ["#brandname", "#brandhaul", "#brandfinds"]
+  }
+]
+
+Return ONLY valid JSON, no additional text."""
+
+
+@lru_cache(maxsize=1)
+def _get_client() -> Anthropic:
+    """
+    Shared Claude client, so its HTTP connection pool is reused across calls.
+
+    The sync client is used (it is thread-safe) rather than AsyncAnthropic,
+    whose pool is bound to one event loop; Celery tasks call into this module
+    through a fresh asyncio.run() each time. Async callers go via to_thread.
+    """
+    return Anthropic(api_key=settings.CLAUDE_API_KEY)
+
+
 class AIService:
     """Service for AI analysis of trends using Claude or mock data."""
 
@@ -186,9 +257,7 @@ class AIService:
             raise ValueError("CLAUDE_API_KEY not configured for real AI analysis")
 
         try:
-            from anthropic import Anthropic
-
-            client = Anthropic(api_key=settings.CLAUDE_API_KEY)
+            client = _get_client()
 
             prompt = f"""Analyze this fashion trend item from {source_platform}.
 
@@ -209,7 +278,8 @@ Please provide a detailed analysis in JSON format with the following fields:
 
 Return ONLY valid JSON, no additional text."""
 
-            message = client.messages.create(
+            message = await asyncio.to_thread(
+                client.messages.create,
                 model="claude-sonnet-4-5-20250929",
                 max_tokens=1024,
                 messages=[{"role": "user", "content": prompt}],
@@ -217,9 +287,8 @@ Return ONLY valid JSON, no additional text."""
 
             # Parse the response
             response_text = message.content[0].text
-            import json
 
-            analysis = json.loads(_clean_json_response(response_text))
+            analysis = orjson.loads(_clean_json_response(response_text))
             return analysis
 
         except Exception as e:
@@ -232,19 +301,21 @@ Return ONLY valid JSON, no additional text."""
         trends: List[tuple]
     ) -> List[Dict]:
         """
-        Analyze multiple trends concurrently.
+        Analyze multiple trends concurrently, at most AI_CONCURRENCY at a time.
 
         Args:
             trends: List of (url, source_platform) tuples
 
         Returns:
-            List of analysis results
+            List of analysis results, in the same order as ``trends``
         """
-        tasks = [
-            AIService.analyze_trend(url, platform)
-            for url, platform in trends
-        ]
-        return await asyncio.gather(*tasks)
+        semaphore = asyncio.Semaphore(settings.AI_CONCURRENCY)
+
+        async def _analyze(url: str, platform: str) -> Dict:
+            async with semaphore:
+                return await AIService.analyze_trend(url, platform)
+
+        return await asyncio.gather(*(_analyze(url, platform) for url, platform in trends))
 
     @staticmethod
     async def suggest_sources(existing_sources: List[Dict]) -> List[Dict]:
@@ -301,9 +372,7 @@ Return ONLY valid JSON, no additional text."""
             raise ValueError("CLAUDE_API_KEY not configured")
 
         try:
-            from anthropic import Anthropic
-
-            client = Anthropic(api_key=settings.CLAUDE_API_KEY)
+            client = _get_client()
 
             source_list = "\n".join(
                 f"- {s.get('name', 'Unknown')} ({s.get('url', '')})" for s in existing_sources
@@ -337,15 +406,15 @@ Return ONLY valid JSON as an array of objects, each with:
 
 Return ONLY valid JSON, no additional text."""
 
-            message = client.messages.create(
+            message = await asyncio.to_thread(
+                client.messages.create,
                 model="claude-sonnet-4-5-20250929",
                 max_tokens=1024,
                 messages=[{"role": "user", "content": prompt}],
             )
 
-            import json
             response_text = message.content[0].text
-            suggestions = json.loads(_clean_json_response(response_text))
+            suggestions = orjson.loads(_clean_json_response(response_text))
             return suggestions
 
         except Exception as e:
@@ -415,10 +484,7 @@ Return ONLY valid JSON, no additional text."""
             raise ValueError("CLAUDE_API_KEY not configured")
 
         try:
-            from anthropic import Anthropic
-            import json
-
-            client = Anthropic(api_key=settings.CLAUDE_API_KEY)
+            client = _get_client()
             all_results = []
 
             # Process in batches to avoid token limits
@@ -429,67 +495,18 @@ Return ONLY valid JSON, no additional text."""
                     for b in batch
                 )
 
-                prompt = f"""You are helping a women's fast fashion apparel company (Mark Edwards Apparel) build a social media intelligence database. Their primary market is junior girls (15-25) and young women (25-35).
-
-For each of the following ecommerce fashion brands, provide their social media accounts and related influencer accounts.
-
-Brands:
-{brand_list}
-
-For EACH brand, provide:
-1. Their official TikTok account (handle and URL) — use real, known handles
-2. Their official Instagram account (handle and URL) — use real, known handles
-3. 1-2 related influencer/creator accounts on TikTok or Instagram who frequently feature that brand (hauls, try-ons, styling videos)
-4. 2-3 relevant hashtags used for that brand on social media
-
-IMPORTANT RULES:
-- Use REAL social media handles that actually exist. If you're not sure about a handle, use the most common/likely format.
-- For official accounts, the handle is usually the brand name (e.g., @zara, @shein, @prettylittlething)
-- For influencers, suggest real popular fashion creators who are known to feature these brands
-- Focus on accounts popular with junior girls (15-25) — Gen Z fashion content
-- Include estimated follower counts where known
-
-Return ONLY valid JSON as an array of objects with this structure:
-[
-  {{
-    "brand": "Brand Name",
-    "accounts": [
-      {{
-        "platform": "tiktok" or "instagram",
-        "handle": "@handle",
-        "url": "https://www.tiktok.com/@handle" or "https://www.instagram.com/handle/",
-        "name": "Display Name",
-        "type": "official",
-        "description": "Brief description",
-        "estimated_followers": "1M+" or "500K" etc
-      }}
-    ],
-    "related_influencers": [
-      {{
-        "platform": "tiktok" or "instagram",
-        "handle": "@handle",
-        "url": "full URL",
-        "name": "Creator Name",
-        "description": "Why they're relevant to this brand",
-        "estimated_followers": "200K" etc
-      }}
-    ],
-    "hashtags": ["#brandname", "#brandhaul", "#brandfinds"]
-  }}
-]
-
-Return ONLY valid JSON, no additional text."""
-
-                message = client.messages.create(
+                message = await asyncio.to_thread(
+                    client.messages.create,
                     model="claude-sonnet-4-5-20250929",
                     max_tokens=4096,
-                    messages=[{"role": "user", "content": prompt}],
+                    system=_SOCIAL_DISCOVERY_SYSTEM_PROMPT,
+                    messages=[{"role": "user", "content": f"Brands:\n{brand_list}"}],
                 )
 
                 response_text = message.content[0].text
                 cleaned = _clean_json_response(response_text)
                 try:
-                    batch_results = json.loads(cleaned)
+                    batch_results = orjson.loads(cleaned)
                 except json.JSONDecodeError as je:
                     # Log the error with context for debugging
                     print(f"JSON parse error on batch {i//batch_size + 1}: {je}")
@@ -533,10 +550,7 @@ Return ONLY valid JSON, no additional text."""
             raise ValueError("CLAUDE_API_KEY not configured")
 
         try:
-            from anthropic import Anthropic
-            import json
-
-            client = Anthropic(api_key=settings.CLAUDE_API_KEY)
+            client = _get_client()
             all_results = []
 
             for i in range(0, len(brands), batch_size):
@@ -575,7 +589,8 @@ IMPORTANT: Make products realistic for each brand's actual style and price range
 Return ONLY valid JSON as a flat array of product objects. Do NOT nest by brand — return one flat array.
 Return ONLY valid JSON, no additional text."""
 
-                message = client.messages.create(
+                message = await asyncio.to_thread(
+                    client.messages.create,
                     model="claude-sonnet-4-5-20250929",
                     max_tokens=8192,
                     messages=[{"role": "user", "content": prompt}],
@@ -584,7 +599,7 @@ Return ONLY valid JSON, no additional text."""
                 response_text = message.content[0].text
                 cleaned = _clean_json_response(response_text)
                 try:
-                    batch_results = json.loads(cleaned)
+                    batch_results = orjson.loads(cleaned)
                     # Attach source_id from our brand list
                     brand_id_map = {b.get('name', ''): b.get('id') for b in batch}
                     for item in batch_results:
@@ -623,10 +638,7 @@ Return ONLY valid JSON, no additional text."""
         if not settings.CLAUDE_API_KEY:
             raise ValueError("CLAUDE_API_KEY not configured")
 
-        from anthropic import Anthropic
-        import json
-
-        client = Anthropic(api_key=settings.CLAUDE_API_KEY)
+        client = _get_client()
 
         # Build the data summary for Claude
         category_summaries = []
@@ -669,7 +681,7 @@ Return ONLY valid JSON, no additional text."""
 
         response_text = message.content[0].text
         cleaned = _clean_json_response(response_text)
-        return json.loads(cleaned)
+        return orjson.loads(cleaned)
 
     @staticmethod
     def generate_themed_looks_sync(all_trend_summary: str, categories: List[str]) -> List[Dict]:
@@ -687,10 +699,7 @@ Return ONLY valid JSON, no additional text."""
         if not settings.CLAUDE_API_KEY:
             raise ValueError("CLAUDE_API_KEY not configured")
 
-        from anthropic import Anthropic
-        import json
-
-        client = Anthropic(api_key=settings.CLAUDE_API_KEY)
+        client = _get_client()
 
         prompt = f"""You are a creative fashion director for Mark Edwards Apparel, creating themed lookbook concepts based on current trend data from 40+ ecommerce brands in early 2026.
 
@@ -728,7 +737,7 @@ Return ONLY valid JSON as an array of themed look objects. No additional text.""
 
         response_text = message.content[0].text
         cleaned = _clean_json_response(response_text)
-        return json.loads(cleaned)
+        return orjson.loads(cleaned)
 
     @staticmethod
     async def generate_recommendations(
@@ -745,10 +754,7 @@ Return ONLY valid JSON as an array of themed look objects. No additional text.""
             raise ValueError("CLAUDE_API_KEY not configured")
 
         try:
-            from anthropic import Anthropic
-            import json
-
-            client = Anthropic(api_key=settings.CLAUDE_API_KEY)
+            client = _get_client()
 
             # Build feedback context
             feedback_context = ""
@@ -783,7 +789,8 @@ For EACH recommendation, provide:
 
 Return ONLY valid JSON as a flat array of recommendation objects. No additional text."""
 
-            message = client.messages.create(
+            message = await asyncio.to_thread(
+                client.messages.create,
                 model="claude-sonnet-4-5-20250929",
                 max_tokens=4096,
                 messages=[{"role": "user", "content": prompt}],
@@ -791,7 +798,7 @@ Return ONLY valid JSON as a flat array of recommendation objects. No additional
 
             response_text = message.content[0].text
             cleaned = _clean_json_response(response_text)
-            results = json.loads(cleaned)
+            results = orjson.loads(cleaned)
             return results if isinstance(results, list) else []
 
         except Exception as e:
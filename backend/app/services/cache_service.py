@@ -0,0 +1,81 @@
+"""
+Redis-backed response cache for hot read endpoints.
+
+Keys are prefixed with a per-namespace version counter. Writers call
+``invalidate`` to bump the version instead of scanning for keys, and the
+orphaned entries simply age out via their TTL. If Redis is unreachable the
+cache is skipped — reads miss and writes are dropped — so requests never
+fail because of it.
+"""
+
+import hashlib
+import logging
+from typing import Optional, Union
+
+import orjson
+import redis
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+_redis = redis.Redis.from_url(
+    settings.REDIS_URL,
+    socket_timeout=0.5,
+    socket_connect_timeout=0.5,
+)
+
+
+class CacheService:
+    """Versioned get/set helpers around the shared Redis connection."""
+
+    DAILY_NAMESPACE = "daily"
+    DAILY_TTL_SECONDS = 45
+    DASHBOARD_NAMESPACE = "dashboard"
+    DASHBOARD_TTL_SECONDS = 60
+    # Everything derived from trend_items; trend writers invalidate all of it
+    TREND_NAMESPACES = (DAILY_NAMESPACE, DASHBOARD_NAMESPACE)
+
+    @staticmethod
+    def versioned_key(namespace: str, *parts) -> Optional[str]:
+        """
+        Build a cache key under the namespace's current version.
+
+        Returns None when Redis is unavailable, meaning "don't cache".
+        """
+        try:
+            version = _redis.get(f"{namespace}:version") or b"0"
+        except redis.RedisError as e:
+            logger.debug("Cache unavailable: %s", e)
+            return None
+        # Hash an encoding of the parts, not a ":"-join of them, so values that
+        # contain ":" can't make two different requests share a key
+        suffix = hashlib.sha256(orjson.dumps(parts)).hexdigest()
+        return f"{namespace}:v{version.decode()}:{suffix}"
+
+    @staticmethod
+    def get(key: str) -> Optional[bytes]:
+        """Return the cached payload, or None on a miss."""
+        try:
+            return _redis.get(key)
+        except redis.RedisError as e:
+            logger.debug("Cache read failed for %s: %s", key, e)
+            return None
+
+    @staticmethod
+    def set(key: str, payload: Union[str, bytes], ttl_seconds: int):
+        try:
+            _redis.setex(key, ttl_seconds, payload)
+        except redis.RedisError as e:
+            logger.debug("Cache write failed for %s: %s", key, e)
+
+    @staticmethod
+    def invalidate(*namespaces: str):
+        """Drop every entry in the namespaces by bumping their versions."""
+        try:
+            with _redis.pipeline(transaction=False) as pipe:
+                for namespace in namespaces:
+                    pipe.incr(f"{namespace}:version")
+                pipe.execute()
+        except redis.RedisError as e:
+            logger.warning("Cache invalidation failed for %s: %s", ", ".join(namespaces), e)
@@ -1,6 +1,9 @@
 import math
 from datetime import datetime, timedelta
-from typing import Dict
+from typing import Dict, List, Tuple
+
+import numpy as np
+
 from app.models.models import TrendItem
 
 
@@ -175,3 +178,87 @@ class ScoringService:
         item.velocity_score = scores["velocity_score"]
         item.cross_platform_score = scores["cross_platform_score"]
         return item
+
+    @staticmethod
+    def compute_scores_batch(
+        likes,
+        comments,
+        shares,
+        views,
+        velocity_multiplier: float = 1.0,
+        recency_factor: float = 1.0,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Vectorized scoring for many items at once.
+
+        Applies the same formulas as calculate_engagement_score and
+        calculate_trend_score, but over whole metric columns. The defaults
+        match a freshly created item (no metrics history, not yet submitted),
+        which is what the seed generators produce.
+
+        Args:
+            likes, comments, shares, views: 1-D array-likes of equal length
+
+        Returns:
+            Tuple of (trend_score, velocity_score, cross_platform_score) arrays
+        """
+        likes = np.asarray(likes, dtype=np.float64)
+        comments = np.asarray(comments, dtype=np.float64)
+        shares = np.asarray(shares, dtype=np.float64)
+        views = np.asarray(views, dtype=np.float64)
+
+        engagement = (
+            np.log10(likes + 1) / 5 * 0.3
+            + np.log10(comments + 1) / 4 * 0.3
+            + np.log10(shares + 1) / 4 * 0.25
+            + np.log10(views + 1) / 6 * 0.15
+        ) * 100
+        engagement = np.minimum(engagement, 100)
+
+        cross_platform = np.zeros_like(engagement)
+        trend = (
+            engagement * ScoringService.BASE_ENGAGEMENT_WEIGHT
+            + engagement * velocity_multiplier * ScoringService.VELOCITY_WEIGHT
+            + engagement * recency_factor * ScoringService.RECENCY_WEIGHT
+            + cross_platform
+        )
+        trend = np.minimum(trend, ScoringService.MAX_TREND_SCORE)
+
+        return (
+            np.round(trend, 2),
+            np.round(engagement * velocity_multiplier, 2),
+            np.round(cross_platform, 2),
+        )
+
+    @staticmethod
+    def score_batch(rows: List[Dict]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Score row dicts (TrendItem column names) in place before a bulk insert.
+
+        Stacks likes/comments/shares/views into one array, runs
+        compute_scores_batch over its columns, and writes trend_score,
+        velocity_score and cross_platform_score back into each dict.
+
+        Args:
+            rows: Dicts with likes/comments/shares/views keys
+
+        Returns:
+            Tuple of (trend_score, velocity_score) arrays, in row order
+        """
+        counts = np.array(
+            [
+                (row.get("likes") or 0, row.get("comments") or 0, row.get("shares") or 0, row.get("views") or 0)
+                for row in rows
+            ],
+            dtype=np.float64,
+        ).reshape(-1, 4)
+        trend, velocity, cross_platform = ScoringService.compute_scores_batch(
+            counts[:, 0], counts[:, 1], counts[:, 2], counts[:, 3]
+        )
+        for row, trend_score, velocity_score, cross_score in zip(
+            rows, trend.tolist(), velocity.tolist(), cross_platform.tolist()
+        ):
+            row["trend_score"] = trend_score
+            row["velocity_score"] = velocity_score
+            row["cross_platform_score"] = cross_score
+        return trend, velocity
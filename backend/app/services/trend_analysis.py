@@ -10,7 +10,7 @@ import re
 from collections import Counter, defaultdict
 from datetime import datetime, timedelta
 from typing import Optional
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy import func, desc
 
 from app.models.people import Person, ScrapedPost
@@ -197,22 +197,23 @@ class TrendAnalysisEngine:
             for trend_key in trends:
                 all_trend_keys[trend_key].add(person_id)
 
-        for trend_key, people_set in all_trend_keys.items():
-            if len(people_set) >= min_mentions:
-                # Look up person names
-                people_names = []
-                people_objs = self.db.query(Person.name).filter(
-                    Person.id.in_(list(people_set))
-                ).all()
-                people_names = [p.name for p in people_objs]
-
-                kind, term = trend_key.split(":", 1)
-                cross_person.append({
-                    "trend": term,
-                    "type": "style" if kind == "style" else "category",
-                    "people_count": len(people_set),
-                    "people": people_names[:10],
-                })
+        cross_keys = {k: ids for k, ids in all_trend_keys.items() if len(ids) >= min_mentions}
+        # Look up every name needed in one query rather than one per trend
+        cross_ids = set().union(*cross_keys.values())
+        names = dict(
+            self.db.query(Person.id, Person.name).filter(Person.id.in_(cross_ids)).all()
+        ) if cross_ids else {}
+
+        for trend_key, people_set in cross_keys.items():
+            people_names = [names[pid] for pid in people_set if pid in names]
+
+            kind, term = trend_key.split(":", 1)
+            cross_person.append({
+                "trend": term,
+                "type": "style" if kind == "style" else "category",
+                "people_count": len(people_set),
+                "people": people_names[:10],
+            })
 
         cross_person.sort(key=lambda x: x["people_count"], reverse=True)
 
@@ -288,7 +289,8 @@ class TrendAnalysisEngine:
         """Get a feed of scraped posts with filtering."""
         cutoff = datetime.utcnow() - timedelta(days=days)
 
-        query = self.db.query(ScrapedPost).filter(
+        # Authors come in one batched SELECT ... WHERE id IN (...) per page
+        query = self.db.query(ScrapedPost).options(selectinload(ScrapedPost.person)).filter(
             ScrapedPost.scraped_at >= cutoff
         )
 
@@ -310,16 +312,9 @@ class TrendAnalysisEngine:
 
         posts = query.offset(offset).limit(limit).all()
 
-        # Load person names
-        person_ids = list(set(p.person_id for p in posts))
-        person_map = {}
-        if person_ids:
-            people = self.db.query(Person).filter(Person.id.in_(person_ids)).all()
-            person_map = {p.id: p for p in people}
-
         feed = []
         for post in posts:
-            person = person_map.get(post.person_id)
+            person = post.person
             feed.append({
                 "id": post.id,
                 "person_id": post.person_id,
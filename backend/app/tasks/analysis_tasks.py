@@ -0,0 +1,63 @@
+"""
+Celery tasks for on-demand AI analysis of existing trends.
+
+A re-analysis waits several seconds on Claude, so POST /api/trends/{id}/analyze
+only enqueues it and answers 202; clients poll the job URL for the result.
+"""
+
+import asyncio
+import logging
+
+from sqlalchemy.orm import selectinload
+
+from app.celery_app import celery
+from app.models.database import SessionLocal
+from app.models.models import TrendItem
+from app.services.ai_service import AIService
+from app.services.cache_service import CacheService
+from app.services.scoring_service import ScoringService
+
+logger = logging.getLogger(__name__)
+
+
+@celery.task(
+    name="app.tasks.analysis_tasks.reanalyze_trend",
+    ignore_result=False,  # GET /api/trends/analyze/jobs/<id> reads the outcome
+)
+def reanalyze_trend(trend_id: int) -> dict:
+    """Re-run AI analysis on a trend and rescore it."""
+    with SessionLocal() as db:
+        source = (
+            db.query(TrendItem.url, TrendItem.source_platform)
+            .filter(TrendItem.id == trend_id)
+            .first()
+        )
+    if not source:
+        return {"error": f"Trend {trend_id} not found"}
+
+    # No connection is held while we wait on the model
+    analysis = asyncio.run(AIService.analyze_trend(source.url, source.source_platform))
+
+    with SessionLocal() as db:
+        # Velocity scoring reads the metrics history
+        trend = db.get(TrendItem, trend_id, options=[selectinload(TrendItem.metrics_history)])
+        if not trend:
+            return {"error": f"Trend {trend_id} not found"}
+
+        # Update fields
+        trend.category = analysis.get("category")
+        trend.subcategory = analysis.get("subcategory")
+        trend.colors = analysis.get("colors")
+        trend.patterns = analysis.get("patterns")
+        trend.style_tags = analysis.get("style_tags")
+        trend.price_point = analysis.get("price_point")
+        trend.ai_analysis_text = analysis.get("narrative")
+
+        # Recalculate scores
+        trend = ScoringService.update_trend_scores(trend)
+
+        db.commit()
+
+    CacheService.invalidate(*CacheService.TREND_NAMESPACES)
+    logger.info(f"Re-analyzed trend {trend_id}")
+    return {"trend_id": trend_id, "trend_score": trend.trend_score, "velocity_score": trend.velocity_score}
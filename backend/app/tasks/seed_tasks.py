@@ -0,0 +1,751 @@
+"""
+Celery tasks for AI seed trend generation.
+
+Seeding runs a batch of Claude calls per brand/account list and can take
+several minutes, so it runs on the worker instead of inside the API
+process. Progress is kept in a Redis hash so any API replica can answer
+the /seed/status polls.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import re
+from typing import Optional
+
+import orjson
+import redis
+from anthropic import AsyncAnthropic, RateLimitError
+
+from app.celery_app import celery
+from app.config import settings
+from app.models.database import SessionLocal
+from app.models.models import TrendItem, TrendMetricsHistory
+from app.services.cache_service import CacheService
+from app.services.scoring_service import ScoringService
+
+logger = logging.getLogger(__name__)
+
+_redis = redis.Redis.from_url(settings.REDIS_URL, decode_responses=True)
+
+
+# Celery limits for one seed run (the global task limits are sized for scrapes)
+_SEED_SOFT_TIME_LIMIT = 1800
+_SEED_TIME_LIMIT = 2100
+# A "running" status expires if no worker finishes it (killed worker, lost
+# message), so a dead job can't block new /seed requests forever
+_RUNNING_STATUS_TTL_SECONDS = _SEED_TIME_LIMIT + 900
+# Finished jobs stay readable at seed:job:<id> for a week
+_JOB_HISTORY_TTL_SECONDS = 7 * 24 * 3600
+
+
+def _job_key(job_id: str) -> str:
+    return f"seed:job:{job_id}"
+
+
+class SeedStatus:
+    """Progress of a seed job, stored as a Redis hash keyed by job type.
+
+    Every write is a single HSET/HINCRBY or one MULTI/EXEC, and snapshot() is
+    one HGETALL, so a poll never sees a half-applied update.
+    """
+
+    def __init__(self, key: str, defaults: dict):
+        self.key = key
+        self.defaults = defaults
+
+    @staticmethod
+    def _encode(value):
+        return int(value) if isinstance(value, bool) else value
+
+    def _queue_reset(self, pipe, fields: dict):
+        mapping = {**self.defaults, **fields}
+        pipe.delete(self.key)
+        pipe.hset(self.key, mapping={k: self._encode(v) for k, v in mapping.items()})
+        if mapping.get("running"):
+            pipe.expire(self.key, _RUNNING_STATUS_TTL_SECONDS)
+
+    def reset(self, **fields):
+        """Replace the stored status with the defaults plus ``fields``."""
+        pipe = _redis.pipeline()
+        self._queue_reset(pipe, fields)
+        pipe.execute()
+
+    def start(self, **fields) -> bool:
+        """Reset to a running status unless a job is already running.
+
+        The check and the reset run under WATCH, so of two concurrent
+        callers exactly one gets True.
+        """
+        with _redis.pipeline() as pipe:
+            try:
+                pipe.watch(self.key)
+                if pipe.hget(self.key, "running") == "1":
+                    return False
+                pipe.multi()
+                self._queue_reset(pipe, {**fields, "running": True})
+                pipe.execute()
+                return True
+            except redis.WatchError:
+                return False
+
+    def update(self, **fields):
+        _redis.hset(self.key, mapping={k: self._encode(v) for k, v in fields.items()})
+
+    def incr(self, field: str, amount: int = 1, **fields):
+        """Bump a counter, setting any ``fields`` in the same MULTI/EXEC."""
+        pipe = _redis.pipeline(transaction=True)
+        pipe.hincrby(self.key, field, amount)
+        if fields:
+            pipe.hset(self.key, mapping={k: self._encode(v) for k, v in fields.items()})
+        pipe.execute()
+
+    def finish(self, **fields):
+        """Mark the job done and keep a copy of its final status by job id."""
+        pipe = _redis.pipeline(transaction=True)
+        pipe.hset(self.key, mapping={k: self._encode(v) for k, v in {"running": False, "done": True, **fields}.items()})
+        pipe.persist(self.key)
+        pipe.execute()
+        status = self.snapshot()
+        if status["job_id"]:
+            _redis.setex(_job_key(status["job_id"]), _JOB_HISTORY_TTL_SECONDS, json.dumps(status))
+
+    def snapshot(self) -> dict:
+        """Return the current status with the same types as ``defaults``."""
+        raw = _redis.hgetall(self.key)
+        status = {}
+        for field, default in self.defaults.items():
+            value = raw.get(field)
+            if value is None:
+                status[field] = default
+            elif isinstance(default, bool):
+                status[field] = value == "1"
+            elif isinstance(default, int):
+                status[field] = int(value)
+            else:
+                status[field] = value
+        return status
+
+
+ECOMMERCE_SEED_STATUS = SeedStatus("seed:ecommerce", {
+    "job_id": "",
+    "running": False,
+    "progress": "",
+    "created": 0,
+    "skipped": 0,
+    "errors": 0,
+    "total_brands": 0,
+    "brands_processed": 0,
+    "cached_batches": 0,
+    "done": False,
+})
+
+SOCIAL_SEED_STATUS = SeedStatus("seed:social", {
+    "job_id": "",
+    "running": False,
+    "done": False,
+    "created": 0,
+    "skipped": 0,
+    "errors": 0,
+    "cached_batches": 0,
+    "progress": "",
+})
+
+
+def get_seed_job(job_id: str) -> Optional[dict]:
+    """
+    Status of a seed job by id, or None if unknown/expired.
+
+    Finished jobs come from their saved final status; the current job comes
+    from its live status plus the Celery task state (PENDING/STARTED/...).
+    """
+    raw = _redis.get(_job_key(job_id))
+    if raw:
+        return json.loads(raw)
+    for seed_status in (ECOMMERCE_SEED_STATUS, SOCIAL_SEED_STATUS):
+        current = seed_status.snapshot()
+        if current["job_id"] == job_id:
+            return {**current, "state": celery.AsyncResult(job_id).state}
+    return None
+
+
+# ============ Seed generation prompts ============
+
+_SEED_MODEL = "claude-sonnet-4-5-20250929"
+# Bump to retire cached seed responses when generation changes without a prompt edit
+_SEED_PROMPT_VERSION = 1
+_SEED_MAX_TOKENS = 16384
+# Sized so a batch's output (~170 tokens per item) stays under _SEED_MAX_TOKENS;
+# a batch that still overflows is split in half and retried
+_SEED_BATCH_SIZE = 15
+_SEED_TRENDS_PER_BRAND = 5
+_SOCIAL_SEED_BATCH_SIZE = 20
+_SOCIAL_POSTS_PER_ACCOUNT = 3
+# Concurrent Claude calls per seed job, and 429 handling
+_SEED_CONCURRENCY = 8
+_SEED_RATE_LIMIT_RETRIES = 3
+_SEED_RATE_LIMIT_DEFAULT_WAIT = 10.0
+# URLs per IN (...) lookup when de-duplicating against trend_items
+_URL_LOOKUP_CHUNK = 500
+# Identical batch requests reuse the previous run's items for a week
+_RESPONSE_CACHE_TTL_SECONDS = 7 * 24 * 3600
+
+_STRING_LIST = {"type": "array", "items": {"type": "string"}}
+
+_SEED_SYSTEM_PROMPT = f"""You are helping a women's fast fashion apparel company (Mark Edwards Apparel) populate their trend intelligence dashboard with realistic trending products from competitor brands.
+
+For each brand the user lists, generate {_SEED_TRENDS_PER_BRAND} REALISTIC trending products that this brand would currently stock in early 2026. Use your knowledge of each brand's actual product range, price point, and target demographic.
+
+For EACH product, provide:
+- brand: The brand name (must match exactly)
+- product_url: A realistic URL for this product on their site (use real URL patterns like /products/, /p/, /dp/)
+- category: Fashion category (e.g., "midi dress", "crop top", "cargo pants", "mini skirt", "oversized blazer", "platform sneakers", "slip dress", "wide leg jeans", "tank top", "maxi dress")
+- colors: Array of 1-3 colors (e.g., ["black", "cream"], ["sage green"])
+- patterns: Array of patterns (e.g., ["solid"], ["floral", "ditsy"], ["plaid"])
+- style_tags: Array of 2-4 style tags (e.g., ["y2k", "streetwear"], ["clean girl", "minimal"], ["cottagecore", "romantic"])
+- fabrications: Array of materials (e.g., ["cotton"], ["polyester", "spandex"], ["denim"])
+- price_point: "budget" | "mid" | "luxury"
+- demographic: "junior_girls" | "young_women" | "contemporary"
+- narrative: 1-2 sentence explanation of why this product is trending
+- estimated_likes: Realistic number between 500-50000
+- estimated_comments: Realistic number between 50-5000
+- estimated_shares: Realistic number between 20-2000
+- estimated_views: Realistic number between 5000-500000
+
+IMPORTANT: Make products realistic for each brand's actual style and price range. Use real fashion categories and current 2026 trend language.
+
+Record every product with the record_products tool as one flat list. Do NOT nest by brand."""
+
+_SEED_PRODUCTS_TOOL = {
+    "name": "record_products",
+    "description": "Record the generated trending products as one flat list.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "items": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "brand": {"type": "string"},
+                        "product_url": {"type": "string"},
+                        "category": {"type": "string"},
+                        "colors": _STRING_LIST,
+                        "patterns": _STRING_LIST,
+                        "style_tags": _STRING_LIST,
+                        "fabrications": _STRING_LIST,
+                        "price_point": {"type": "string", "enum": ["budget", "mid", "luxury"]},
+                        "demographic": {"type": "string", "enum": ["junior_girls", "young_women", "contemporary"]},
+                        "narrative": {"type": "string"},
+                        "estimated_likes": {"type": "integer"},
+                        "estimated_comments": {"type": "integer"},
+                        "estimated_shares": {"type": "integer"},
+                        "estimated_views": {"type": "integer"},
+                    },
+                    "required": ["brand", "product_url", "category"],
+                },
+            },
+        },
+        "required": ["items"],
+    },
+}
+
+_SOCIAL_SEED_SYSTEM_PROMPT = f"""You are helping a women's fast fashion apparel company (Mark Edwards Apparel) populate their trend intelligence dashboard with realistic SOCIAL MEDIA trending posts from brand and influencer accounts in early 2026.
+
+For each social media account the user lists, generate {_SOCIAL_POSTS_PER_ACCOUNT} REALISTIC trending posts that this account would publish. These should be the kind of viral, high-engagement fashion content that drives trends.
+
+For EACH post, provide:
+- account_name: The account name (must match exactly)
+- platform: The social media platform (instagram, tiktok, pinterest — must match the account's platform)
+- post_url: A realistic post URL (use real URL patterns like instagram.com/p/xxx, tiktok.com/@user/video/xxx, pinterest.com/pin/xxx)
+- post_type: "reel" | "carousel" | "story" | "video" | "pin" | "outfit_post" | "haul" | "styling_tip" | "trend_alert"
+- category: Fashion category (e.g., "midi dress", "crop top", "cargo pants", "mini skirt", "oversized blazer", "platform sneakers", "slip dress", "wide leg jeans", "tank top", "maxi dress", "leggings", "puffer jacket", "blazer", "boots")
+- colors: Array of 1-3 colors
+- patterns: Array of patterns
+- style_tags: Array of 2-4 trending style tags (e.g., ["quiet luxury", "clean girl"], ["mob wife", "coastal cowgirl"], ["coquette", "balletcore"], ["dark academia", "preppy"])
+- fabrications: Array of materials
+- price_point: "budget" | "mid" | "luxury"
+- demographic: "junior_girls" | "young_women" | "contemporary"
+- caption: A realistic social media caption (1-2 sentences with hashtags)
+- estimated_likes: Realistic social media scale — 1000-500000
+- estimated_comments: 100-50000
+- estimated_shares: 50-100000
+- estimated_views: 10000-5000000
+
+IMPORTANT: Make posts realistic for each account's actual content style. TikTok posts should feel like TikTok (viral outfit checks, hauls). Instagram should feel like Instagram (curated aesthetics, reels). Pinterest should feel like Pinterest (mood boards, outfit inspo).
+
+Record every post with the record_posts tool as one flat list."""
+
+_SOCIAL_POSTS_TOOL = {
+    "name": "record_posts",
+    "description": "Record the generated trending social media posts as one flat list.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "items": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "account_name": {"type": "string"},
+                        "platform": {"type": "string"},
+                        "post_url": {"type": "string"},
+                        "post_type": {"type": "string"},
+                        "category": {"type": "string"},
+                        "colors": _STRING_LIST,
+                        "patterns": _STRING_LIST,
+                        "style_tags": _STRING_LIST,
+                        "fabrications": _STRING_LIST,
+                        "price_point": {"type": "string", "enum": ["budget", "mid", "luxury"]},
+                        "demographic": {"type": "string", "enum": ["junior_girls", "young_women", "contemporary"]},
+                        "caption": {"type": "string"},
+                        "estimated_likes": {"type": "integer"},
+                        "estimated_comments": {"type": "integer"},
+                        "estimated_shares": {"type": "integer"},
+                        "estimated_views": {"type": "integer"},
+                    },
+                    "required": ["account_name", "platform", "post_url", "category"],
+                },
+            },
+        },
+        "required": ["items"],
+    },
+}
+
+
+# Fallback fix-up for the occasional trailing comma in model output
+_TRAILING_COMMA_RE = re.compile(rb",\s*([}\]])")
+
+
+def _retry_after_seconds(headers) -> float:
+    """Seconds to wait after a 429, from the retry-after header if present."""
+    try:
+        return max(float(headers.get("retry-after", 0)), 1.0)
+    except (TypeError, ValueError):
+        return _SEED_RATE_LIMIT_DEFAULT_WAIT
+
+
+def _parse_json_array(raw) -> list:
+    """Parse the JSON array out of a raw Claude response.
+
+    Slices from the first '[' to the last ']' — which drops code fences and
+    any surrounding prose — and hands the bytes straight to orjson. The
+    trailing-comma regex only runs if that strict parse fails.
+    """
+    if isinstance(raw, str):
+        raw = raw.encode()
+    start, end = raw.find(b"["), raw.rfind(b"]")
+    if start == -1 or end < start:
+        raise json.JSONDecodeError("No JSON array found in response", raw[:200].decode(errors="replace"), 0)
+    payload = memoryview(raw)[start:end + 1]
+    try:
+        return orjson.loads(payload)
+    except orjson.JSONDecodeError:
+        return orjson.loads(_TRAILING_COMMA_RE.sub(rb"\1", bytes(payload)))
+
+
+def _prompt_fingerprint(system_prompt: str, tool: dict) -> str:
+    """Short hash of everything static in a seed request, computed once per kind.
+
+    Covers the model, _SEED_PROMPT_VERSION, the system prompt and the tool
+    schema, so any edit to them moves the response cache to fresh keys.
+    """
+    return hashlib.sha256(
+        orjson.dumps([_SEED_MODEL, _SEED_PROMPT_VERSION, system_prompt, tool], option=orjson.OPT_SORT_KEYS)
+    ).hexdigest()[:16]
+
+
+def _response_cache_key(prompt_key: str, user_content: str) -> str:
+    """Exact-match key for one batch: the static prompt's fingerprint plus the batch's list."""
+    return f"seed:response:{prompt_key}:{hashlib.sha256(user_content.encode()).hexdigest()}"
+
+
+def _cached_batch_items(key: str) -> Optional[list]:
+    try:
+        cached = _redis.get(key)
+    except redis.RedisError as e:
+        logger.debug("Seed response cache read failed: %s", e)
+        return None
+    return orjson.loads(cached) if cached else None
+
+
+def _cache_batch_items(key: str, items: list):
+    try:
+        _redis.setex(key, _RESPONSE_CACHE_TTL_SECONDS, orjson.dumps(items))
+    except redis.RedisError as e:
+        logger.debug("Seed response cache write failed: %s", e)
+
+
+async def _generate_batch_items(client, kind: dict, user_content: str, force: bool = False) -> tuple:
+    """Run one seed batch through Claude and return the generated item dicts.
+
+    The static instructions travel in a cached system block, so only the short
+    per-batch list is new input on each call. The cached prefix is the tool
+    schema, the forced-tool preamble and the system prompt together — about
+    1,100 tokens for products and 1,200 for social posts, just over the
+    1024-token minimum; _call_batch warns if a call neither writes nor reads
+    the cache. The forced tool call hands back
+    already-structured items; a plain-text answer is parsed as a fallback.
+    The reply is streamed: the SDK folds each input_json delta into the tool
+    input as it arrives, so parsing overlaps generation and there is no big
+    parse step after the last token. On a 429 the call waits out the
+    server's retry-after and tries again.
+
+    Complete (untruncated) results are cached in Redis under a hash of the
+    request, so re-seeding the same brands skips the call entirely. ``force``
+    skips the lookup and overwrites the entry with a fresh reply.
+
+    Returns:
+        (items, truncated, from_cache) — truncated is True when the reply hit
+        max_tokens; from_cache is True when no call was made
+    """
+    cache_key = _response_cache_key(kind["prompt_key"], user_content)
+    if not force:
+        cached = _cached_batch_items(cache_key)
+        if cached is not None:
+            return cached, False, True
+
+    items, truncated = await _call_batch(client, kind["system_prompt"], kind["tool"], user_content)
+    if not truncated:
+        _cache_batch_items(cache_key, items)
+    return items, truncated, False
+
+
+# Tools whose prompt came back uncached, so the warning is logged once per process
+_uncached_tools = set()
+
+
+async def _call_batch(client, system_prompt: str, tool: dict, user_content: str) -> tuple:
+    for attempt in range(_SEED_RATE_LIMIT_RETRIES + 1):
+        try:
+            async with client.messages.stream(
+                model=_SEED_MODEL,
+                max_tokens=_SEED_MAX_TOKENS,
+                system=[{"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}],
+                tools=[tool],
+                tool_choice={"type": "tool", "name": tool["name"]},
+                messages=[{"role": "user", "content": user_content}],
+            ) as stream:
+                message = await stream.get_final_message()
+            break
+        except RateLimitError as e:
+            if attempt == _SEED_RATE_LIMIT_RETRIES:
+                raise
+            delay = _retry_after_seconds(e.response.headers)
+            logger.warning("Seed batch rate limited; retrying in %.1fs", delay)
+            await asyncio.sleep(delay)
+
+    usage = message.usage
+    if not (usage.cache_creation_input_tokens or usage.cache_read_input_tokens) and tool["name"] not in _uncached_tools:
+        # Caching is silently skipped when the prefix is under the minimum
+        _uncached_tools.add(tool["name"])
+        logger.warning(
+            "Seed prompt for %s was not cached (%s input tokens); it may be under the caching minimum",
+            tool["name"], usage.input_tokens,
+        )
+
+    truncated = message.stop_reason == "max_tokens"
+    if truncated:
+        logger.warning("Seed batch hit max_tokens (%s); output may be truncated", _SEED_MAX_TOKENS)
+
+    for block in message.content:
+        if block.type == "tool_use":
+            items = block.input.get("items", [])
+            return (items if isinstance(items, list) else []), truncated
+    text = "".join(block.text for block in message.content if block.type == "text")
+    try:
+        return _parse_json_array(text), truncated
+    except json.JSONDecodeError:
+        if truncated:
+            return [], truncated
+        raise
+
+
+def _normalize_estimates(items: list, defaults: dict):
+    """Coerce the AI-estimated engagement counts to non-negative ints in place.
+
+    Args:
+        items: Generated item dicts
+        defaults: Mapping of estimated_likes/comments/shares/views → fallback value
+    """
+    for key, default in defaults.items():
+        for item in items:
+            try:
+                item[key] = max(int(item.get(key, default) or 0), 0)
+            except (TypeError, ValueError):
+                item[key] = default
+
+
+async def _generate_items(kind: dict, sources: list, force: bool = False) -> list:
+    """Generate items for all batches of ``sources``, up to _SEED_CONCURRENCY at a time.
+
+    Args:
+        kind: _ECOMMERCE_SEED or _SOCIAL_SEED
+        sources: Brand/account dicts with name, url and id
+        force: Bypass the seed response cache
+    """
+    status = kind["status"]
+    batch_size = kind["batch_size"]
+    client = AsyncAnthropic(api_key=settings.CLAUDE_API_KEY)
+    semaphore = asyncio.Semaphore(_SEED_CONCURRENCY)
+    batches = [sources[i:i + batch_size] for i in range(0, len(sources), batch_size)]
+    total_batches = len(batches)
+    all_results = []
+
+    async def process(batch_num: int, batch: list):
+        source_list = "\n".join(kind["format_source"](s) for s in batch)
+        async with semaphore:
+            status.update(progress=f"Processing batch {batch_num}/{total_batches} ({', '.join(s.get('name', '') for s in batch)})...")
+            try:
+                batch_results, truncated, from_cache = await _generate_batch_items(
+                    client, kind, f"{kind['list_header']}:\n{source_list}", force=force
+                )
+            except json.JSONDecodeError as je:
+                logger.warning("JSON parse error on %s batch %s: %s", kind["label"], batch_num, je)
+                status.update(progress=f"Batch {batch_num} had JSON error, continuing...")
+                return
+            except Exception as e:
+                logger.exception("Error on %s batch %s", kind["label"], batch_num)
+                status.update(progress=f"Batch {batch_num} error: {str(e)[:100]}, continuing...")
+                return
+
+        # A reply cut off at max_tokens loses items, so re-run the batch as two
+        # halves (outside the semaphore, which the halves need to acquire)
+        if truncated and len(batch) > 1:
+            mid = len(batch) // 2
+            logger.info("Splitting truncated %s batch %s (%s → %s + %s)", kind["label"], batch_num, len(batch), mid, len(batch) - mid)
+            await asyncio.gather(process(batch_num, batch[:mid]), process(batch_num, batch[mid:]))
+            return
+        if from_cache:
+            status.incr("cached_batches")
+
+        # Attach source_id from our brand/account list
+        source_id_map = {s.get('name', ''): s.get('id') for s in batch}
+        for item in batch_results:
+            item['source_id'] = source_id_map.get(item.get(kind["source_name_key"], ''))
+        all_results.extend(batch_results)
+
+        progress = f"Batch {batch_num}/{total_batches} done — {len(all_results)} {kind['noun']} so far"
+        if kind["processed_field"]:
+            status.incr(kind["processed_field"], len(batch), progress=progress)
+        else:
+            status.update(progress=progress)
+
+    try:
+        await asyncio.gather(*(process(n, batch) for n, batch in enumerate(batches, 1)))
+    finally:
+        await client.close()
+    return all_results
+
+
+def _existing_urls(db, urls: list) -> set:
+    """Return which of ``urls`` are already stored, via the unique url index.
+
+    Looks them up with one IN query per _URL_LOOKUP_CHUNK urls, which keeps
+    the bound-parameter count under SQLite's limit on the dev database.
+    """
+    existing = set()
+    for i in range(0, len(urls), _URL_LOOKUP_CHUNK):
+        chunk = urls[i:i + _URL_LOOKUP_CHUNK]
+        existing.update(
+            url for (url,) in db.query(TrendItem.url).filter(TrendItem.url.in_(chunk)).yield_per(_URL_LOOKUP_CHUNK)
+        )
+    return existing
+
+
+def _insert_seed_rows(rows: list) -> tuple:
+    """Bulk-insert new trend rows plus their initial metrics snapshot.
+
+    URLs already in the table (or repeated within ``rows``) are skipped.
+    Everything goes in with two executemany INSERTs and a single commit.
+
+    Returns:
+        (created, skipped) counts
+    """
+    db = SessionLocal()
+    try:
+        seen = _existing_urls(db, [row["url"] for row in rows])
+        new_rows = []
+        for row in rows:
+            if row["url"] in seen:
+                continue
+            seen.add(row["url"])
+            new_rows.append(row)
+
+        if new_rows:
+            # return_defaults populates each row's "id" for the metrics insert
+            db.bulk_insert_mappings(TrendItem, new_rows, return_defaults=True)
+            db.bulk_insert_mappings(TrendMetricsHistory, [
+                {
+                    "trend_item_id": row["id"],
+                    "likes": row["likes"],
+                    "comments": row["comments"],
+                    "shares": row["shares"],
+                    "views": row["views"],
+                    "trend_score": row["trend_score"],
+                }
+                for row in new_rows
+            ])
+            db.commit()
+            CacheService.invalidate(*CacheService.TREND_NAMESPACES)
+
+        return len(new_rows), len(rows) - len(new_rows)
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def _run_seed_job(kind: dict, sources: list, job_id: str, force: bool = False, **status_fields):
+    """Generate seed items for ``sources`` and save them to the DB.
+
+    Args:
+        kind: _ECOMMERCE_SEED or _SOCIAL_SEED
+        sources: Brand/account dicts with name, url and id
+        job_id: Celery task id, recorded in the status
+        force: Bypass the seed response cache and call Claude for every batch
+        status_fields: Extra fields for the initial status
+    """
+    status = kind["status"]
+    status.reset(running=True, job_id=job_id, progress=kind["start_message"], **status_fields)
+
+    try:
+        all_results = asyncio.run(_generate_items(kind, sources, force=force))
+    except Exception as e:
+        logger.exception("%s AI generation failed", kind["label"].capitalize())
+        status.finish(progress=f"AI generation failed: {str(e)}")
+        return
+
+    status.update(progress=f"Saving {len(all_results)} {kind['saving_noun']} to database...")
+
+    _normalize_estimates(all_results, kind["estimate_defaults"])
+
+    rows = []
+    errors = 0
+    for item in all_results:
+        url = item.get(kind["url_key"], "")
+        if not url:
+            errors += 1
+            continue
+        rows.append({
+            "url": url,
+            "image_url": None,
+            "source_id": item.get("source_id"),
+            "category": item.get("category"),
+            "colors": item.get("colors", []),
+            "patterns": item.get("patterns", []),
+            "style_tags": item.get("style_tags", []),
+            "fabrications": item.get("fabrications", []),
+            "price_point": item.get("price_point", "mid"),
+            "demographic": item.get("demographic", "junior_girls"),
+            "likes": item["estimated_likes"],
+            "comments": item["estimated_comments"],
+            "shares": item["estimated_shares"],
+            "views": item["estimated_views"],
+            "engagement_rate": 0.0,
+            "status": "active",
+            **kind["row_fields"](item),
+        })
+
+    ScoringService.score_batch(rows)
+
+    try:
+        created, skipped = _insert_seed_rows(rows)
+    except Exception:
+        logger.exception("Error saving %s trends", kind["label"])
+        created, skipped, errors = 0, 0, errors + len(rows)
+
+    progress = "Complete!"
+    cached_batches = status.snapshot()["cached_batches"]
+    if cached_batches:
+        # Replayed batches repeat earlier URLs, so they mostly land in skipped
+        progress += f" {cached_batches} batches served from cache; re-run with force=true for fresh results."
+    status.finish(progress=progress, created=created, skipped=skipped, errors=errors)
+
+
+# What differs between the two seed jobs; everything else is shared above
+_ECOMMERCE_SEED = {
+    "label": "seed",
+    "status": ECOMMERCE_SEED_STATUS,
+    "system_prompt": _SEED_SYSTEM_PROMPT,
+    "tool": _SEED_PRODUCTS_TOOL,
+    "prompt_key": _prompt_fingerprint(_SEED_SYSTEM_PROMPT, _SEED_PRODUCTS_TOOL),
+    "batch_size": _SEED_BATCH_SIZE,
+    "list_header": "Brands",
+    "format_source": lambda b: f"- {b.get('name', 'Unknown')} ({b.get('url', '')})",
+    "source_name_key": "brand",
+    "noun": "products",
+    "processed_field": "brands_processed",
+    "start_message": "Starting AI generation...",
+    "saving_noun": "trends",
+    "estimate_defaults": {
+        "estimated_likes": 1000,
+        "estimated_comments": 200,
+        "estimated_shares": 50,
+        "estimated_views": 10000,
+    },
+    "url_key": "product_url",
+    "row_fields": lambda item: {
+        "source_platform": "ecommerce",
+        "submitted_by": "AI Seed Generator",
+        "subcategory": None,
+        "ai_analysis_text": item.get("narrative", ""),
+    },
+}
+
+_SOCIAL_SEED = {
+    "label": "social seed",
+    "status": SOCIAL_SEED_STATUS,
+    "system_prompt": _SOCIAL_SEED_SYSTEM_PROMPT,
+    "tool": _SOCIAL_POSTS_TOOL,
+    "prompt_key": _prompt_fingerprint(_SOCIAL_SEED_SYSTEM_PROMPT, _SOCIAL_POSTS_TOOL),
+    "batch_size": _SOCIAL_SEED_BATCH_SIZE,
+    "list_header": "Accounts",
+    "format_source": lambda a: (
+        f"- {a.get('name', 'Unknown')} (@{a.get('handle', '')}) on {a.get('platform', 'instagram')} — {a.get('url', '')}"
+    ),
+    "source_name_key": "account_name",
+    "noun": "posts",
+    "processed_field": None,
+    "start_message": "Starting social media AI generation...",
+    "saving_noun": "social media trends",
+    "estimate_defaults": {
+        "estimated_likes": 5000,
+        "estimated_comments": 500,
+        "estimated_shares": 200,
+        "estimated_views": 50000,
+    },
+    "url_key": "post_url",
+    "row_fields": lambda item: {
+        "source_platform": (item.get("platform") or "instagram").lower().strip(),
+        "submitted_by": "AI Social Media Seed",
+        "subcategory": item.get("post_type"),
+        "ai_analysis_text": item.get("caption", ""),
+    },
+}
+
+
+@celery.task(
+    bind=True,
+    name="app.tasks.seed_tasks.seed_ecommerce_trends",
+    ignore_result=False,  # get_seed_job reports the task state while it runs
+    soft_time_limit=_SEED_SOFT_TIME_LIMIT,
+    time_limit=_SEED_TIME_LIMIT,
+)
+def seed_ecommerce_trends(self, brands: list, force: bool = False):
+    """Generate and save seed trends for the given ecommerce brands."""
+    _run_seed_job(_ECOMMERCE_SEED, brands, self.request.id, force=force, total_brands=len(brands))
+
+
+@celery.task(
+    bind=True,
+    name="app.tasks.seed_tasks.seed_social_trends",
+    ignore_result=False,  # get_seed_job reports the task state while it runs
+    soft_time_limit=_SEED_SOFT_TIME_LIMIT,
+    time_limit=_SEED_TIME_LIMIT,
+)
+def seed_social_trends(self, accounts: list, force: bool = False):
+    """Generate and save seed posts for the given social media accounts."""
+    _run_seed_job(_SOCIAL_SEED, accounts, self.request.id, force=force)
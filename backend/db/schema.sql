@@ -26,6 +26,7 @@ CREATE TABLE IF NOT EXISTS trend_items (
     shares INTEGER DEFAULT 0,
     views INTEGER DEFAULT 0,
     engagement_rate NUMERIC(5, 2) DEFAULT 0.0,
+    engagement_count INTEGER GENERATED ALWAYS AS (likes + comments + shares) STORED,
 
     -- Scoring
     trend_score NUMERIC(8, 2) DEFAULT 0.0,
@@ -53,6 +54,7 @@ CREATE INDEX idx_trend_items_velocity_score ON trend_items(velocity_score DESC);
 CREATE INDEX idx_trend_items_score_date ON trend_items(trend_score DESC, submitted_at DESC);
 CREATE INDEX idx_trend_items_velocity_date ON trend_items(velocity_score DESC, submitted_at DESC);
 CREATE INDEX idx_trend_items_category_status ON trend_items(category, status);
+CREATE INDEX idx_trend_items_active_engagement ON trend_items(engagement_count DESC, id DESC) WHERE status = 'active';
 
 -- Trend Metrics History table
 CREATE TABLE IF NOT EXISTS trend_metrics_history (
@@ -79,8 +81,7 @@ CREATE TABLE IF NOT EXISTS mood_boards (
     created_by VARCHAR(255) NOT NULL,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
-    category VARCHAR(100),
-    items JSONB DEFAULT '[]'::jsonb
+    category VARCHAR(100)
 );
 
 -- Indexes for mood_boards
@@ -88,6 +89,19 @@ CREATE INDEX idx_mood_boards_created_by ON mood_boards(created_by);
 CREATE INDEX idx_mood_boards_created_at ON mood_boards(created_at DESC);
 CREATE INDEX idx_mood_boards_category ON mood_boards(category);
 
+-- Mood Board Items table (a board's trend items, in board order)
+CREATE TABLE IF NOT EXISTS mood_board_items (
+    mood_board_id INTEGER NOT NULL REFERENCES mood_boards(id) ON DELETE CASCADE,
+    trend_item_id INTEGER NOT NULL REFERENCES trend_items(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    added_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (mood_board_id, trend_item_id)
+);
+
+-- Indexes for mood_board_items
+CREATE INDEX idx_mood_board_items_board_position ON mood_board_items(mood_board_id, position);
+CREATE INDEX ix_mood_board_items_trend_item_id ON mood_board_items(trend_item_id);
+
 -- Trending Hashtags table
 CREATE TABLE IF NOT EXISTS trending_hashtags (
     id SERIAL PRIMARY KEY,
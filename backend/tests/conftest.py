@@ -0,0 +1,28 @@
+import os
+import sys
+
+import pytest
+
+# Make the app package importable when pytest runs from backend/
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Database tests need a throwaway Postgres database (its tables get dropped).
+# Point the app at it before app.models.database builds its engine.
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL", "")
+if TEST_DATABASE_URL:
+    os.environ["DATABASE_URL"] = TEST_DATABASE_URL
+
+
+@pytest.fixture
+def pg_engine():
+    """The app's engine over freshly created tables, dropped again afterwards."""
+    if not TEST_DATABASE_URL.startswith("postgresql"):
+        pytest.skip("set TEST_DATABASE_URL to a disposable PostgreSQL database")
+    pytest.importorskip("sqlalchemy")
+    import app.models  # noqa: F401  (registers every model on Base.metadata)
+    from app.models.database import Base, engine
+
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    yield engine
+    Base.metadata.drop_all(engine)
@@ -0,0 +1,24 @@
+import pytest
+
+
+class _FakeRedis:
+    def get(self, key):
+        return None
+
+
+def test_versioned_key_does_not_collide_on_separators(monkeypatch):
+    """Filter values containing ":" must not produce another request's key."""
+    pytest.importorskip("redis")
+    from app.services import cache_service
+    from app.services.cache_service import CacheService
+
+    monkeypatch.setattr(cache_service, "_redis", _FakeRedis())
+
+    def daily_key(category, demographic):
+        return CacheService.versioned_key(
+            CacheService.DAILY_NAMESPACE, None, category, demographic, "trend_score", 200, 0, False, None
+        )
+
+    # Both joined to ":a:b::trend_score:200:0:False:" under the old scheme
+    assert daily_key("a:b", None) != daily_key("a", "b:")
+    assert daily_key("a:b", None) == daily_key("a:b", None)
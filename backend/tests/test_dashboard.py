@@ -0,0 +1,26 @@
+import json
+
+
+def test_top_tags_counts_jsonb_columns(pg_engine):
+    """db/schema.sql creates the tag columns as JSONB, not JSON."""
+    from sqlalchemy import text
+    from sqlalchemy.orm import Session
+    from app.api.dashboard import _top_tags
+    from app.models.models import TrendItem
+
+    with pg_engine.begin() as conn:
+        conn.execute(text("ALTER TABLE trend_items ALTER COLUMN colors TYPE JSONB USING colors::jsonb"))
+        # "null" is what the ORM stores for colors=None; None is SQL NULL
+        for n, colors in enumerate([["red", "blue"], ["red"], None, "null"]):
+            conn.execute(
+                text(
+                    "INSERT INTO trend_items (url, source_platform, submitted_by, status, colors) "
+                    "VALUES (:url, 'instagram', 'test', 'active', CAST(:colors AS jsonb))"
+                ),
+                {"url": f"https://example.com/trend/{n}", "colors": colors if colors in (None, "null") else json.dumps(colors)},
+            )
+
+    with Session(pg_engine) as db:
+        tags = _top_tags(db, TrendItem.colors, [TrendItem.status == "active"])
+
+    assert [tuple(row) for row in tags] == [("red", 2), ("blue", 1)]
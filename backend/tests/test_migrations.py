@@ -0,0 +1,70 @@
+import json
+
+
+def _insert_trends(conn, count):
+    from sqlalchemy import text
+
+    return [
+        conn.execute(
+            text(
+                "INSERT INTO trend_items (url, source_platform, submitted_by) "
+                "VALUES (:url, 'instagram', 'test') RETURNING id"
+            ),
+            {"url": f"https://example.com/trend/{n}"},
+        ).scalar_one()
+        for n in range(count)
+    ]
+
+
+def test_mood_board_items_move_out_of_jsonb_column(pg_engine):
+    """db/schema.sql creates mood_boards.items as JSONB, not JSON."""
+    from sqlalchemy import inspect, text
+    from app.models.database import run_migrations
+
+    with pg_engine.begin() as conn:
+        conn.execute(text("ALTER TABLE mood_boards ADD COLUMN items JSONB DEFAULT '[]'::jsonb"))
+        trend_ids = _insert_trends(conn, 3)
+        board_id = conn.execute(
+            text(
+                "INSERT INTO mood_boards (title, created_by, items) "
+                "VALUES ('Board', 'test', CAST(:items AS jsonb)) RETURNING id"
+            ),
+            # Board order, with an id whose trend no longer exists
+            {"items": json.dumps([trend_ids[2], trend_ids[0], 999999])},
+        ).scalar_one()
+
+    run_migrations()
+
+    with pg_engine.connect() as conn:
+        moved = conn.execute(
+            text("SELECT trend_item_id FROM mood_board_items WHERE mood_board_id = :b ORDER BY position"),
+            {"b": board_id},
+        ).scalars().all()
+        columns = {c["name"] for c in inspect(conn).get_columns("mood_boards")}
+
+    assert moved == [trend_ids[2], trend_ids[0]]
+    assert "items" not in columns
+
+    run_migrations()  # nothing left to move on the next boot
+
+
+def test_invalid_index_is_rebuilt(pg_engine):
+    """An INVALID index left by a failed CONCURRENTLY build gets replaced."""
+    from sqlalchemy import text
+    from app.models.database import run_migrations
+
+    validity = text(
+        "SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass('idx_trend_items_active_score')"
+    )
+    with pg_engine.begin() as conn:
+        # What Postgres leaves behind when CREATE INDEX CONCURRENTLY fails
+        conn.execute(text(
+            "UPDATE pg_index SET indisvalid = false "
+            "WHERE indexrelid = to_regclass('idx_trend_items_active_score')"
+        ))
+        assert conn.execute(validity).scalar() is False
+
+    run_migrations()
+
+    with pg_engine.connect() as conn:
+        assert conn.execute(validity).scalar() is True
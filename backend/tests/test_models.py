@@ -0,0 +1,45 @@
+import pytest
+
+
+def test_only_eager_loaded_relationships_are_readable(pg_engine):
+    """Relationships are lazy="raise": only what the loader helpers fetch can be read."""
+    from sqlalchemy.exc import InvalidRequestError
+    from sqlalchemy.orm import Session
+    from app.api.moodboards import _get_board
+    from app.api.people import _get_person_with_platforms
+    from app.models.models import MoodBoard, MoodBoardItem, TrendItem
+    from app.models.people import Person, PersonPlatform
+
+    with Session(pg_engine) as db:
+        trend = TrendItem(url="https://example.com/trend/0", source_platform="instagram", submitted_by="test")
+        person = Person(name="Test Person", type="influencer")
+        person.platforms.append(PersonPlatform(platform="instagram", handle="@test"))
+        board = MoodBoard(title="Board", created_by="test")
+        board.entries.append(MoodBoardItem(trend_item=trend, position=0))
+        db.add_all([person, board])
+        db.commit()
+        person_id, board_id, trend_id = person.id, board.id, trend.id
+
+    with Session(pg_engine) as db:
+        person = _get_person_with_platforms(db, person_id)
+        assert [p.handle for p in person.platforms] == ["@test"]
+        with pytest.raises(InvalidRequestError):
+            person.scraped_posts
+
+    with Session(pg_engine) as db:
+        board = _get_board(db, board_id)
+        assert board.items == [trend_id]
+        with pytest.raises(InvalidRequestError):
+            board.entries[0].trend_item
+
+        board = _get_board(db, board_id, with_trends=True)
+        assert board.entries[0].trend_item.id == trend_id
+
+    with Session(pg_engine) as db:
+        board = db.get(MoodBoard, board_id)
+        with pytest.raises(InvalidRequestError):
+            board.entries
+
+        trend = db.get(TrendItem, trend_id)
+        with pytest.raises(InvalidRequestError):
+            trend.metrics_history
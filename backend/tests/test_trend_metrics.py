@@ -0,0 +1,32 @@
+import orjson
+
+
+def test_metrics_serialize_numeric_trend_scores(pg_engine):
+    """db/schema.sql stores trend_score as NUMERIC(8,2), which psycopg2 reads as Decimal."""
+    from sqlalchemy import text
+    from sqlalchemy.orm import Session
+    from app.api.trends import get_trend_metrics
+
+    with pg_engine.begin() as conn:
+        conn.execute(text("ALTER TABLE trend_metrics_history ALTER COLUMN trend_score TYPE NUMERIC(8, 2)"))
+        trend_id = conn.execute(
+            text(
+                "INSERT INTO trend_items (url, source_platform, submitted_by) "
+                "VALUES ('https://example.com/trend', 'instagram', 'test') RETURNING id"
+            )
+        ).scalar_one()
+        conn.execute(
+            text(
+                "INSERT INTO trend_metrics_history (trend_item_id, likes, comments, shares, views, trend_score) "
+                "VALUES (:id, 10, 2, 1, 100, 41.25), (:id, 20, 4, 3, 300, 42.75)"
+            ),
+            {"id": trend_id},
+        )
+
+    with Session(pg_engine) as db:
+        response = get_trend_metrics(trend_id, hours=24, db=db)
+
+    assert response.status_code == 200
+    (point,) = orjson.loads(response.body)
+    assert point["trend_score"] == 42.0
+    assert point["likes"] == 15
@@ -15,7 +15,7 @@ export const getDailyTrends = async (params?: {
   offset?: number
 }): Promise<TrendItem[]> => {
   const response = await client.get('/trends/daily', { params })
-  // Backend returns { items: [...], total, limit, offset }
+  // Backend returns { items: [...], has_more, total, limit, offset }
   const data = response.data
   const items = Array.isArray(data) ? data : (data.items || [])
   // Ensure IDs are strings for React keys
@@ -27,8 +27,11 @@ export const getTrendById = async (id: string): Promise<TrendItem> => {
   return response.data
 }
 
-export const reanalyzeTrend = async (id: string): Promise<TrendItem> => {
-  const response = await client.post<TrendItem>(`/trends/${id}/analyze`, {})
+// Re-analysis runs as a background job; poll status_url for the outcome
+export const reanalyzeTrend = async (
+  id: string
+): Promise<{ job_id: string; trend_id: number; status_url: string }> => {
+  const response = await client.post(`/trends/${id}/analyze`, {})
   return response.data
 }
 
@@ -50,6 +53,7 @@ export const getSeedStatus = async (): Promise<{
   errors: number
   total_brands: number
   brands_processed: number
+  cached_batches: number
   done: boolean
 }> => {
   const response = await client.get('/trends/seed/status')